@@ -55,7 +55,10 @@ from .scale_draw import QwtAbstractScaleDraw
 from .painter import QwtPainter
 
 from .plot_series import (QwtSeriesData, QwtPointArrayData, QwtSeriesStore,
-                             QwtPlotSeriesItem)
+                             QwtPlotSeriesItem, QwtCircularBufferData,
+                             QwtGrowableData, QwtMemMapData)
+
+from .plot_multicurve import QwtPlotMultiCurve
 
 from .plot_renderer import QwtPlotRenderer
 
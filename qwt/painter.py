@@ -15,11 +15,13 @@ QwtPainterClass
 
 from .color_map import QwtColorMap
 from .scale_map import QwtScaleMap
+from .point_mapper import polyline_to_array
 
 from .qt.QtGui import (QPaintEngine, QFrame, QPixmap, QPainter, QPalette, 
                           QStyle, QPen, QStyleOptionFocusRect, QBrush, 
-                          QLinearGradient, QPainterPath, QColor, QStyleOption)
-from .qt.QtCore import Qt, QRect, QPoint, QT_VERSION
+                          QLinearGradient, QPainterPath, QColor, QStyleOption,
+                          QImage)
+from .qt.QtCore import Qt, QRect, QPoint, QLineF, QT_VERSION
 
 QWIDGETSIZE_MAX = (1<<24)-1
 
@@ -49,6 +51,31 @@ def qwtFillRect(widget, painter, rect, brush):
 class QwtPainterClass(object):
     """A collection of `QPainter` workarounds"""
     
+    # None until the first call to drawLines
+    __pointPairsSupported = None
+    
+    def roundingAlignment(self, painter):
+        """
+        Check if the painter is using a paint engine, that aligns
+        coordinates to integers. Today these are all paint engines
+        beside `QPaintEngine.Pdf` and `QPaintEngine.SVG`.
+
+        If we have an integer based paint engine it is also
+        checked if the painter has a transformation matrix,
+        that rotates or scales.
+        
+        :param QPainter painter: Painter
+        :return: True, when the painter is aligning
+        """
+        if painter is not None and painter.isActive():
+            if painter.paintEngine().type() in (QPaintEngine.Pdf,
+                                                QPaintEngine.SVG):
+                return False
+            transform = painter.transform()
+            if transform.isRotating() or transform.isScaling():
+                return False
+        return True
+    
     def drawImage(self, painter, rect, image):
         alignedRect = rect.toAlignedRect()
         if alignedRect != rect:
@@ -71,6 +98,33 @@ class QwtPainterClass(object):
         else:
             painter.drawPixmap(alignedRect, pixmap)
     
+    def drawLines(self, painter, pointPairs):
+        """
+        Draw lines between the consecutive pairs of points of a polygon,
+        as built by :py:func:`.point_mapper.array_to_lines`
+        
+        The polygon is passed as is to `QPainter.drawLines`, unless the 
+        Python bindings don't accept it (the sequence overload of recent
+        PyQt5 releases only converts `QLineF` items): the lines are then 
+        converted to a list of `QLineF` objects.
+        
+        :param QPainter painter: Painter
+        :param QPolygonF pointPairs: Start and end points of the lines
+        """
+        if pointPairs.size() < 2:
+            return
+        if self.__pointPairsSupported is not False:
+            try:
+                painter.drawLines(pointPairs)
+                self.__pointPairsSupported = True
+                return
+            except TypeError:
+                self.__pointPairsSupported = False
+        xs, ys = polyline_to_array(pointPairs, copy=False)
+        painter.drawLines(list(map(QLineF, xs[0::2].tolist(),
+                                   ys[0::2].tolist(), xs[1::2].tolist(),
+                                   ys[1::2].tolist())))
+    
     def drawFocusRect(self, *args):
         if len(args) == 2:
             painter, widget = args
@@ -443,4 +497,23 @@ class QwtPainterClass(object):
                 pm.x11SetScreen(widget.x11Info().screen())
         return pm
 
+    def backingStoreImage(self, size):
+        """
+        :param QSize size: Size of the image
+        :return: An image that can be used as backing store, outside the GUI thread (where pixmaps are not supported)
+        """
+        if QT_VERSION >= 0x050000:
+            pixelRatio = 1.
+            from .qt.QtGui import qApp
+            if qApp is not None:
+                try:
+                    pixelRatio = qApp.devicePixelRatio()
+                except RuntimeError:
+                    pass
+            image = QImage(size*pixelRatio, QImage.Format_ARGB32_Premultiplied)
+            image.setDevicePixelRatio(pixelRatio)
+        else:
+            image = QImage(size, QImage.Format_ARGB32_Premultiplied)
+        return image
+
 QwtPainter = QwtPainterClass()
\ No newline at end of file
@@ -20,8 +20,9 @@ QwtPlotItem
 """
 
 from .qt.QtGui import (QWidget, QFont, QSizePolicy, QFrame, QApplication,
-                          QRegion, QPainter, QPalette)
-from .qt.QtCore import Qt, Signal, QEvent, QSize, QRectF
+                          QRegion, QPainter, QPalette, QImage)
+from .qt.QtCore import (Qt, Signal, QEvent, QSize, QRect, QRectF, QThread,
+                         QTimer, QElapsedTimer, QT_VERSION)
 
 from .text import QwtText, QwtTextLabel
 from .scale_widget import QwtScaleWidget
@@ -192,6 +193,16 @@ class QwtPlot_PrivateData(QwtPlotDict_PrivateData):
         self.legend = None
         self.layout = None
         self.autoReplot = None
+        self.geometryThreadCount = 1
+        self.tileCount = 1
+        self.tileOrientation = Qt.Horizontal
+        self.executor = None
+        self.executorSize = 0
+        self.maxFrameRate = 0
+        self.replotTimer = None
+        self.lastFrame = None
+        self.frameClock = QElapsedTimer()
+        self.frameClock.start()
 
 
 class AxisData(object):
@@ -307,6 +318,9 @@ class QwtPlot(QFrame, QwtPlotDict):
         from .plot_layout import QwtPlotLayout
         self.__data.layout = QwtPlotLayout()
         self.__data.autoReplot = False
+        self.__data.geometryThreadCount = 1
+        self.__data.tileCount = 1
+        self.__data.tileOrientation = Qt.Horizontal
                 
         self.setAutoReplot(True)
 #        self.setPlotLayout(self.__data.layout)
@@ -356,6 +370,7 @@ class QwtPlot(QFrame, QwtPlotDict):
 
     def __del__(self):
         #XXX Is is really necessary in Python? (pure transcription of C++)
+        self.__shutdownExecutor()
         self.setAutoReplot(False)
         self.detachItems(QwtPlotItem.Rtti_PlotItem, self.autoDelete())
         self.__data.layout = None
@@ -984,6 +999,196 @@ class QwtPlot(QFrame, QwtPlotDict):
         """
         return self.__data.autoReplot
     
+    def requestReplot(self):
+        """
+        Request a redraw of the plot
+        
+        Unlike :py:meth:`replot()`, the plot is not redrawn immediately:
+        the requests are coalesced, so that any number of requests result
+        in a single replot, which is done when control returns to the
+        event loop, but not before a frame interval has elapsed since 
+        the previous scheduled replot (see :py:meth:`setMaxFrameRate()`).
+        
+        When a replot takes more time than the frame interval, the 
+        following frames are skipped: the next replot is scheduled at 
+        the next frame interval boundary.
+        
+        .. seealso::
+        
+            :py:meth:`replot()`, :py:meth:`setMaxFrameRate()`
+        """
+        timer = self.__data.replotTimer
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(self.__scheduledReplot)
+            self.__data.replotTimer = timer
+        elif timer.isActive():
+            return
+        delay = 0.
+        lastFrame = self.__data.lastFrame
+        if self.__data.maxFrameRate > 0 and lastFrame is not None:
+            interval = 1./self.__data.maxFrameRate
+            elapsed = self.__frameTime()-lastFrame
+            if elapsed < interval:
+                delay = interval-elapsed
+        timer.start(int(round(1000*delay)))
+    
+    def __scheduledReplot(self):
+        """Replot requested by :py:meth:`requestReplot()`"""
+        #  `lastFrame` is the start of the frame slot of the last replot: 
+        #  requestReplot schedules the next replot one interval after it
+        start = self.__frameTime()
+        self.replot()
+        if self.__data.maxFrameRate > 0:
+            interval = 1./self.__data.maxFrameRate
+            lastFrame = self.__data.lastFrame
+            if lastFrame is not None and start-lastFrame < 2*interval:
+                #  Continuous replots: the slot of this replot is the 
+                #  boundary of the frame grid (lastFrame+k*interval) just
+                #  before it started, so that timer latency doesn't 
+                #  accumulate. k is at least 1, as timers may fire 
+                #  slightly early (then start-lastFrame < interval).
+                #  After an idle period (2 intervals or more), the grid 
+                #  starts again from this replot.
+                start = lastFrame+interval*max([1,
+                                        int((start-lastFrame)/interval)])
+            #  A replot longer than the interval overruns the following
+            #  slots: the slot is moved to the last boundary overrun, so 
+            #  that the next replot is scheduled at the next boundary
+            #  (overrun frames are skipped, instead of being caught up
+            #  by replotting without delay)
+            elapsed = self.__frameTime()-start
+            if elapsed > interval:
+                start += interval*int(elapsed/interval)
+        self.__data.lastFrame = start
+    
+    def __frameTime(self):
+        """
+        Return the time used to schedule replots, in seconds (monotonic 
+        clock: not affected by changes of the system time)
+        """
+        return self.__data.frameClock.nsecsElapsed()*1e-9
+    
+    def setMaxFrameRate(self, fps):
+        """
+        Set the maximum frame rate of the replots requested by 
+        :py:meth:`requestReplot()`
+        
+        The default frame rate is 0 (= no limit: requests are coalesced 
+        until control returns to the event loop).
+        
+        :param float fps: Maximum number of replots per second
+        
+        .. seealso::
+        
+            :py:meth:`maxFrameRate()`, :py:meth:`requestReplot()`
+        """
+        self.__data.maxFrameRate = max([0., fps])
+    
+    def maxFrameRate(self):
+        """
+        :return: Maximum number of replots per second (0 = no limit)
+        
+        .. seealso::
+        
+            :py:meth:`setMaxFrameRate()`
+        """
+        return self.__data.maxFrameRate
+    
+    def setGeometryThreadCount(self, numThreads):
+        """
+        Set the number of threads used to prepare the geometry of the 
+        plot items before drawing them
+        
+        When more than one thread is used, :py:meth:`drawItems()` works
+        in two phases: first, the device coordinates of all visible items
+        are computed in parallel by a pool of threads (see 
+        :py:meth:`QwtPlotItem.prepareGeometry()`), then the items are 
+        painted one after another. As most of the work of the first phase
+        is done by NumPy, which releases the GIL, replotting many heavy 
+        curves scales with the number of cores.
+        
+        The default thread count is 1 (= no additional threads, items 
+        are prepared while being drawn).
+        
+        Requires the `concurrent.futures` module (on Python 2, the 
+        `futures` backport): otherwise, items are drawn sequentially.
+        
+        :param int numThreads: Number of threads. If numThreads is set to 0, the system specific ideal thread count is used.
+
+        .. seealso::
+        
+            :py:meth:`geometryThreadCount()`
+        """
+        numThreads = max([0, numThreads])
+        if numThreads != self.__data.geometryThreadCount:
+            self.__data.geometryThreadCount = numThreads
+            self.__shutdownExecutor()
+    
+    def geometryThreadCount(self):
+        """
+        :return: Number of threads used to prepare the geometry of the plot items. If numThreads is set to 0, the system specific ideal thread count is used.
+
+        .. seealso::
+        
+            :py:meth:`setGeometryThreadCount()`
+        """
+        return self.__data.geometryThreadCount
+    
+    def setTileCount(self, numTiles, orientation=Qt.Horizontal):
+        """
+        Set the number of tiles used to render the plot items into images
+        
+        When plot items are drawn into a `QImage` (e.g. when exporting the
+        plot to a PNG file with :py:meth:`.plot_renderer.QwtPlotRenderer.renderDocument()`)
+        and more than one tile is used, the canvas area is split into 
+        tiles, which are rendered in parallel by a pool of threads
+        (one thread per tile) and then copied into the image.
+        
+        The geometry of the items is prepared once before rendering the 
+        tiles (see :py:meth:`setGeometryThreadCount()`), and every tile 
+        is rendered from the same geometry, clipped to the tile: the 
+        result is exactly the same as when rendering without tiles.
+        
+        The default tile count is 1 (= no tiles).
+        
+        Requires the `concurrent.futures` module (on Python 2, the 
+        `futures` backport): otherwise, items are drawn without tiles.
+        
+        :param int numTiles: Number of tiles. If numTiles is set to 0, the system specific ideal thread count is used.
+        :param Qt.Orientation orientation: `Qt.Horizontal` for horizontal bands (stacked vertically), `Qt.Vertical` for vertical bands (side by side)
+
+        .. seealso::
+        
+            :py:meth:`tileCount()`, :py:meth:`tileOrientation()`
+        """
+        numTiles = max([0, numTiles])
+        if numTiles != self.__data.tileCount:
+            self.__data.tileCount = numTiles
+            self.__shutdownExecutor()
+        self.__data.tileOrientation = orientation
+    
+    def tileCount(self):
+        """
+        :return: Number of tiles used to render the plot items into images. If numTiles is set to 0, the system specific ideal thread count is used.
+
+        .. seealso::
+        
+            :py:meth:`setTileCount()`
+        """
+        return self.__data.tileCount
+    
+    def tileOrientation(self):
+        """
+        :return: Orientation of the tiles used to render the plot items into images
+
+        .. seealso::
+        
+            :py:meth:`setTileCount()`
+        """
+        return self.__data.tileOrientation
+    
     def setTitle(self, title):
         """
         Change the plot's title
@@ -1144,6 +1349,9 @@ class QwtPlot(QFrame, QwtPlotDict):
         
             :py:meth:`updateAxes()`, :py:meth:`setAutoReplot()`
         """
+        if self.__data.replotTimer is not None:
+            #  This replot handles the pending requests
+            self.__data.replotTimer.stop()
         doAutoReplot = self.autoReplot()
         self.setAutoReplot(False)
         self.updateAxes()
@@ -1321,17 +1529,186 @@ class QwtPlot(QFrame, QwtPlotDict):
             Due to a bug in Qt this rectangle might be wrong for certain 
             frame styles ( f.e `QFrame.Box` ) and it might be necessary to 
             fix the margins manually using `QWidget.setContentsMargins()`
+        
+        .. seealso::
+        
+            :py:meth:`setGeometryThreadCount()`, :py:meth:`setTileCount()`
         """
-        for item in self.itemList():
-            if item and item.isVisible():
-                painter.save()
-                painter.setRenderHint(QPainter.Antialiasing,
-                          item.testRenderHint(QwtPlotItem.RenderAntialiased))
-                painter.setRenderHint(QPainter.HighQualityAntialiasing,
-                          item.testRenderHint(QwtPlotItem.RenderAntialiased))
-                item.draw(painter, maps[item.xAxis()], maps[item.yAxis()],
-                          canvasRect)
-                painter.restore()
+        items = [item for item in self.itemList()
+                 if item and item.isVisible()]
+        if self.__drawItemsTiled(painter, items, canvasRect, maps):
+            return
+        futures = self.prepareItems(items, canvasRect, maps)
+        for index, item in enumerate(items):
+            if futures is not None:
+                futures[index].result()
+            self.drawItem(painter, item, canvasRect, maps)
+    
+    def drawItem(self, painter, item, canvasRect, maps):
+        """
+        Draw a plot item, with the render hints of the item
+        
+        :param QPainter painter: Painter used for drawing
+        :param QwtPlotItem item: Plot item
+        :param QRectF canvasRect: Bounding rectangle where to paint
+        :param list maps: `QwtPlot.axisCnt` maps, mapping between plot and paint device coordinates
+        
+        .. seealso::
+        
+            :py:meth:`drawItems()`
+        """
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing,
+                      item.testRenderHint(QwtPlotItem.RenderAntialiased))
+        painter.setRenderHint(QPainter.HighQualityAntialiasing,
+                      item.testRenderHint(QwtPlotItem.RenderAntialiased))
+        item.draw(painter, maps[item.xAxis()], maps[item.yAxis()],
+                  canvasRect)
+        painter.restore()
+    
+    def __drawItemsTiled(self, painter, items, canvasRect, maps):
+        """
+        Draw plot items into the image of the painter, split into tiles 
+        rendered in parallel: return False if items can't be drawn this 
+        way (tiles disabled, painter not drawing into an image, ...)
+        """
+        numTiles = self.__data.tileCount
+        if numTiles == 0:
+            numTiles = QThread.idealThreadCount()
+        image = painter.device()
+        if numTiles < 2 or not items or not isinstance(image, QImage):
+            return False
+        transform = painter.transform()
+        #  Tiles are clipped in device coordinates: rotated painters, 
+        #  high-DPI images and non-rectangular clips are drawn as usual
+        if transform.isRotating() or (QT_VERSION >= 0x050000 and
+                                      image.devicePixelRatio() != 1.):
+            return False
+        if painter.hasClipping() and painter.clipRegion().rectCount() > 1:
+            return False
+        rect = transform.mapRect(QRectF(canvasRect)).toAlignedRect()
+        if painter.hasClipping():
+            clipRect = transform.mapRect(painter.clipBoundingRect())
+            rect &= clipRect.toAlignedRect()
+        rect &= image.rect()
+        if rect.isEmpty():
+            return True
+        executor = self.__executor()
+        if executor is None:
+            return False
+        #  The geometry of the items is prepared once for all tiles
+        futures = self.prepareItems(items, canvasRect, maps)
+        for index, item in enumerate(items):
+            if futures is None:
+                item.prepareGeometry(maps[item.xAxis()], maps[item.yAxis()],
+                                     canvasRect)
+            else:
+                futures[index].result()
+        if self.__data.tileOrientation == Qt.Horizontal:
+            bounds = np.linspace(rect.top(), rect.bottom()+1, numTiles+1)
+            tileRects = [QRect(rect.left(), y1, rect.width(), y2-y1)
+                         for y1, y2 in zip(bounds[:-1].astype(int), 
+                                           bounds[1:].astype(int))]
+        else:
+            bounds = np.linspace(rect.left(), rect.right()+1, numTiles+1)
+            tileRects = [QRect(x1, rect.top(), x2-x1, rect.height())
+                         for x1, x2 in zip(bounds[:-1].astype(int), 
+                                           bounds[1:].astype(int))]
+        tileRects = [tileRect for tileRect in tileRects
+                     if not tileRect.isEmpty()]
+        #  Tiles are drawn in place, into the pixels of the image shared 
+        #  by all tiles (detached here, on the GUI thread): the geometry 
+        #  of the items is the same for all tiles, and only clipped by 
+        #  the paint engine, so that the image is exactly the same as 
+        #  without tiles
+        bits = image.bits()
+        futures = [executor.submit(self.__drawTile, painter, bits, tileRect,
+                                   items, canvasRect, maps)
+                   for tileRect in tileRects]
+        for future in futures:
+            future.result()
+        return True
+    
+    def __drawTile(self, painter, bits, tileRect, items, canvasRect, maps):
+        """
+        Draw plot items into a tile of the image of the painter (worker 
+        thread, where symbols are cached into images instead of pixmaps)
+        """
+        image = painter.device()
+        tile = QImage(bits, image.width(), image.height(),
+                      image.bytesPerLine(), image.format())
+        tilePainter = QPainter(tile)
+        try:
+            tilePainter.setRenderHints(painter.renderHints())
+            tilePainter.setFont(painter.font())
+            tilePainter.setPen(painter.pen())
+            tilePainter.setBrush(painter.brush())
+            tilePainter.setOpacity(painter.opacity())
+            tilePainter.setCompositionMode(painter.compositionMode())
+            tilePainter.setClipRect(tileRect)
+            tilePainter.setTransform(painter.transform())
+            if painter.hasClipping():
+                tilePainter.setClipRect(painter.clipBoundingRect(),
+                                        Qt.IntersectClip)
+            for item in items:
+                self.drawItem(tilePainter, item, canvasRect, maps)
+        finally:
+            tilePainter.end()
+    
+    def __executor(self):
+        """
+        Return the pool of threads (`concurrent.futures.ThreadPoolExecutor`)
+        of the plot, large enough for the geometry thread count and for 
+        the tile count, or None if the `concurrent.futures` module is not 
+        available
+        """
+        numThreads = max([self.__data.geometryThreadCount or
+                          QThread.idealThreadCount(),
+                          self.__data.tileCount or
+                          QThread.idealThreadCount()])
+        executor = self.__data.executor
+        if executor is None or self.__data.executorSize != numThreads:
+            try:
+                from concurrent.futures import ThreadPoolExecutor
+            except ImportError:
+                return
+            self.__shutdownExecutor()
+            executor = ThreadPoolExecutor(numThreads)
+            self.__data.executor = executor
+            self.__data.executorSize = numThreads
+        return executor
+    
+    def __shutdownExecutor(self):
+        """
+        Shut down the pool of threads of the plot, if any (without 
+        waiting for the tasks in progress)
+        """
+        if self.__data.executor is not None:
+            self.__data.executor.shutdown(wait=False)
+            self.__data.executor = None
+            self.__data.executorSize = 0
+    
+    def prepareItems(self, items, canvasRect, maps):
+        """
+        Prepare the geometry of plot items in parallel, when more than one
+        thread is used (see :py:meth:`setGeometryThreadCount()`)
+        
+        :param list items: Plot items
+        :param QRectF canvasRect: Bounding rectangle where to paint
+        :param list maps: `QwtPlot.axisCnt` maps, mapping between plot and paint device coordinates
+        :return: List of `concurrent.futures.Future` objects (one per item), or None if items are not prepared in parallel
+        """
+        numThreads = self.__data.geometryThreadCount
+        if numThreads == 0:
+            numThreads = QThread.idealThreadCount()
+        if numThreads < 2 or len(items) < 2:
+            return
+        executor = self.__executor()
+        if executor is None:
+            return
+        return [executor.submit(item.prepareGeometry,
+                                maps[item.xAxis()], maps[item.yAxis()],
+                                canvasRect) for item in items]
 
     def canvasMap(self, axisId):
         """
@@ -1607,11 +1984,13 @@ class QwtPlotItem_PrivateData(object):
         self.attributes = 0
         self.interests = 0
         self.renderHints = 0
+        self.renderThreadCount = 1
         self.z = 0.
         self.xAxis = QwtPlot.xBottom
         self.yAxis = QwtPlot.yLeft
         self.legendIconSize = QSize(8, 8)
         self.title = None # QwtText
+        self.layer = None
 
 
 class QwtPlotItem(object):
@@ -1642,6 +2021,10 @@ class QwtPlotItem(object):
     Depending on the `QwtPlotItem.ItemAttribute` flags, an item is included
     into autoscaling or has an entry on the legend.
     
+    With the `QwtPlotItem.Static` attribute, an item lying below all the
+    non-static items in z-order is part of the static layer of the canvas 
+    (see `QwtPlotCanvas.StaticLayer` paint attribute).
+    
     Before misusing the existing item classes it might be better to
     implement a new type of plot item
     ( don't implement a watermark as spectrogram ).
@@ -1666,13 +2049,14 @@ class QwtPlotItem(object):
      Rtti_PlotIntervalCurve, Rtti_PlotHistogram, Rtti_PlotSpectrogram,
      Rtti_PlotSVG, Rtti_PlotTradingCurve, Rtti_PlotBarChart,
      Rtti_PlotMultiBarChart, Rtti_PlotShape, Rtti_PlotTextLabel,
-     Rtti_PlotZone) = list(range(17))
+     Rtti_PlotZone, Rtti_PlotMultiCurve) = list(range(18))
     Rtti_PlotUserItem = 1000
     
     # enum ItemAttribute
     Legend = 0x01
     AutoScale = 0x02
     Margins = 0x04
+    Static = 0x08
     
     # enum ItemInterest
     ScaleInterest = 0x01
@@ -1779,6 +2163,36 @@ class QwtPlotItem(object):
                 self.__data.plot.attachItem(self, True)
             self.itemChanged()
     
+    def setLayer(self, layer):
+        """
+        Assign the item to a named layer
+        
+        When the `QwtPlotCanvas.LayerCache` paint attribute is enabled, 
+        the plot items are rendered into cached pixmaps, which are 
+        composited in z-order: consecutive items (in z-order) of the same 
+        layer share a pixmap, other items have their own pixmap.
+        
+        :param layer: Layer name (if None, the item has its own pixmap)
+        :type layer: str or None
+        
+        .. seealso::
+        
+            :py:meth:`layer()`, :py:meth:`.plot_canvas.QwtPlotCanvas.invalidateLayer()`
+        """
+        if layer != self.__data.layer:
+            self.__data.layer = layer
+            self.itemChanged()
+    
+    def layer(self):
+        """
+        :return: Name of the layer of the item (None, if the item has its own layer)
+        
+        .. seealso::
+        
+            :py:meth:`setLayer()`
+        """
+        return self.__data.layer
+    
     def setTitle(self, title):
         """
         Set a new title
@@ -1901,6 +2315,33 @@ class QwtPlotItem(object):
         """
         return bool(self.__data.renderHints & hint)
     
+    def setRenderThreadCount(self, numThreads):
+        """
+        On multi core systems rendering of certain plot item 
+        (f.e `QwtPlotCurve` in `QwtPlotCurve.ImageBuffer` mode) can be done 
+        in parallel. This method specifies the number of threads to be used 
+        for rendering.
+        
+        The default thread count is 1 (= no additional threads)
+        
+        :param int numThreads: Number of threads to be used for rendering. If numThreads is set to 0, the system specific ideal thread count is used.
+
+        .. seealso::
+        
+            :py:meth:`renderThreadCount()`
+        """
+        self.__data.renderThreadCount = max([0, numThreads])
+    
+    def renderThreadCount(self):
+        """
+        :return: Number of threads to be used for rendering. If numThreads is set to 0, the system specific ideal thread count is used.
+
+        .. seealso::
+        
+            :py:meth:`setRenderThreadCount()`
+        """
+        return self.__data.renderThreadCount
+    
     def setLegendIconSize(self, size):
         """
         Set the size of the legend icon
@@ -2002,6 +2443,9 @@ class QwtPlotItem(object):
             :py:meth:`QwtPlot.legendChanged()`, :py:meth:`QwtPlot.autoRefresh()`
         """
         if self.__data.plot:
+            canvas = self.__data.plot.canvas()
+            if isinstance(canvas, QwtPlotCanvas):
+                canvas.invalidateLayer(self)
             self.__data.plot.autoRefresh()
     
     def legendChanged(self):
@@ -2105,6 +2549,28 @@ class QwtPlotItem(object):
         """
         return QRectF(1.0, 1.0, -2.0, -2.0)
     
+    def prepareGeometry(self, xMap, yMap, canvasRect):
+        """
+        Prepare the geometry drawn by the next call to `draw()` with the 
+        same arguments (e.g. map data to paint device coordinates)
+        
+        This method may be called from a worker thread, when the geometry 
+        of the items of the plot is prepared in parallel (see 
+        :py:meth:`QwtPlot.setGeometryThreadCount()`): it must not paint
+        anything nor access widgets.
+        
+        It is also called once before drawing the items into tiles (see 
+        :py:meth:`QwtPlot.setTileCount()`): the tiles, drawn in parallel, 
+        should then only read the prepared geometry.
+        
+        The default implementation does nothing.
+        
+        :param .scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+        :param .scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+        :param QRectF canvasRect: Contents rectangle of the canvas
+        """
+        pass
+    
     def getCanvasMarginHint(self, xMap, yMap, canvasRect):
         """
         Calculate a hint for the canvas margin
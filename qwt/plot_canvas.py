@@ -15,12 +15,17 @@ QwtPlotCanvas
 
 from .null_paintdevice import QwtNullPaintDevice
 from .painter import QwtPainter
+from .scale_map import qwtScaleMapKey
 
 from .qt import PYQT5
 from .qt.QtGui import (QFrame, QPaintEngine, QPen, QBrush, QRegion, QImage,
                           QPainterPath, QPixmap, QGradient, QPainter, qAlpha,
-                          QPolygonF, QStyleOption, QStyle, QStyleOptionFrame)
-from .qt.QtCore import Qt, QSizeF, QT_VERSION, QEvent, QPointF, QRectF
+                          QPolygonF, QStyleOption, QStyle, QStyleOptionFrame,
+                          QPicture)
+from .qt.QtCore import (Qt, QSizeF, QT_VERSION, QEvent, QPointF, QRectF,
+                         Signal)
+
+import threading
 
 
 class Border(object):
@@ -310,6 +315,10 @@ class QwtPlotCanvas_PrivateData(object):
         self.borderRadius = 0
         self.paintAttributes = 0
         self.backingStore = None
+        self.asyncFrame = None
+        self.asyncDirty = True
+        self.asyncThread = None
+        self.layers = {}
         self.styleSheet = StyleSheet()
         self.styleSheet.hasBorder = False
 
@@ -379,6 +388,67 @@ class QwtPlotCanvas(QFrame):
             
                 :py:meth:`replot()`, :py:meth:`QWidget.repaint()`, 
                 :py:meth:`QWidget.update()`
+        
+        * `QwtPlotCanvas.AsyncRendering`:
+        
+            Rasterize the plot items into a `QImage` in a worker thread
+            
+            When AsyncRendering is set, the geometry of the plot items is 
+            first prepared by worker threads, from the current data and 
+            scale maps (see :py:meth:`.plot.QwtPlotItem.prepareGeometry()`:
+            curves compute their geometry from the series they had when 
+            the preparation started). The plot items are then drawn on 
+            the GUI thread into a `QPicture`, which records the drawing 
+            commands (reusing the prepared geometry) without rasterizing 
+            them: items modified in the meantime compute their geometry 
+            again. This snapshot of the frame is finally rasterized by a 
+            worker thread, while the GUI thread keeps handling user events:
+            this thread never accesses the plot items. Until the new frame 
+            is ready, the last rendered frame is displayed. Replots 
+            requested while a frame is being rendered are merged into a 
+            single new frame.
+            
+            .. note::
+            
+                As the paint device is a `QPicture`, symbols are drawn as
+                vector graphics whatever their cache policy (see 
+                :py:meth:`.symbol.QwtSymbol.setCachePolicy()`), and plot 
+                items are not rendered as tiles (see
+                :py:meth:`.plot.QwtPlot.setTileCount()`).
+        
+        * `QwtPlotCanvas.LayerCache`:
+        
+            Render the plot items into cached pixmaps (layers)
+            
+            Consecutive items (in z-order) assigned to the same layer 
+            (see :py:meth:`.plot.QwtPlotItem.setLayer()`) share a pixmap, 
+            other items have a pixmap of their own. On replot, the pixmaps 
+            are composited in z-order and only the layers of the items 
+            which have changed since the last paint are rendered again. 
+            All layers are rendered again when the canvas is resized or 
+            when a scale has changed.
+            
+            .. warning::
+            
+                A layer is invalidated by `QwtPlotItem.itemChanged()`: 
+                when the data of an item is modified in place, the 
+                `itemChanged()` (or `dataChanged()`) method of the item 
+                has to be called, or the layers invalidated with 
+                :py:meth:`invalidateLayers()`.
+        
+        * `QwtPlotCanvas.StaticLayer`:
+        
+            Render the static plot items into a background pixmap
+            
+            Items having the `QwtPlotItem.Static` attribute (typically 
+            grids and markers, in animated plots) and lying below all the 
+            other items in z-order are rendered once into a pixmap, which 
+            is drawn first: this pixmap is rendered again only when the 
+            canvas is resized, when a scale has changed or when one of the 
+            static items has changed. The other (dynamic) items are drawn 
+            on top of it on each replot (using their own layers, if 
+            `QwtPlotCanvas.LayerCache` is also enabled), in z-order: static
+            items above a dynamic item are drawn like dynamic items.
                 
     Focus indicators:
     
@@ -413,6 +483,12 @@ class QwtPlotCanvas(QFrame):
     Opaque = 2
     HackStyledBackground = 4
     ImmediatePaint = 8
+    AsyncRendering = 16
+    LayerCache = 32
+    StaticLayer = 64
+    
+    asyncGeometryPrepared = Signal()
+    asyncFrameRendered = Signal("PyQt_PyObject")
     
     # enum FocusIndicator
     NoFocusIndicator, CanvasFocusIndicator, ItemFocusIndicator = list(range(3))
@@ -428,6 +504,8 @@ class QwtPlotCanvas(QFrame):
         self.setPaintAttribute(QwtPlotCanvas.BackingStore, False)
         self.setPaintAttribute(QwtPlotCanvas.Opaque, True)
         self.setPaintAttribute(QwtPlotCanvas.HackStyledBackground, True)
+        self.asyncGeometryPrepared.connect(self.__asyncGeometryPrepared)
+        self.asyncFrameRendered.connect(self.__asyncFrameRendered)
     
     def plot(self):
         """
@@ -445,6 +523,9 @@ class QwtPlotCanvas(QFrame):
             * `QwtPlotCanvas.Opaque`
             * `QwtPlotCanvas.HackStyledBackground`
             * `QwtPlotCanvas.ImmediatePaint`
+            * `QwtPlotCanvas.AsyncRendering`
+            * `QwtPlotCanvas.LayerCache`
+            * `QwtPlotCanvas.StaticLayer`
         
         :param int attribute: Paint attribute
         :param bool on: On/Off
@@ -479,6 +560,11 @@ class QwtPlotCanvas(QFrame):
                 self.setAttribute(Qt.WA_OpaquePaintEvent, True)
         elif attribute in (self.HackStyledBackground, self.ImmediatePaint):
             pass
+        elif attribute == self.AsyncRendering:
+            self.__data.asyncFrame = None
+            self.__data.asyncDirty = True
+        elif attribute in (self.LayerCache, self.StaticLayer):
+            self.__data.layers = {}
         
     def testPaintAttribute(self, attribute):
         """
@@ -672,7 +758,12 @@ class QwtPlotCanvas(QFrame):
             else:
 #                print('**DEBUG: QwtPlotCanvas.drawCanvas')
                 painter.setClipRect(self.contentsRect(), Qt.IntersectClip)
-        self.plot().drawCanvas(painter)
+        if self.testPaintAttribute(self.AsyncRendering):
+            self.drawAsyncFrame(painter)
+        elif self.testPaintAttribute(self.LayerCache|self.StaticLayer):
+            self.drawLayers(painter)
+        else:
+            self.plot().drawCanvas(painter)
         painter.restore()
         if withBackground and hackStyledBackground:
             #  Now paint the border on top
@@ -680,6 +771,220 @@ class QwtPlotCanvas(QFrame):
             opt.initFrom(self)
             self.style().drawPrimitive(QStyle.PE_Frame, opt, painter, self)
     
+    def drawLayers(self, painter):
+        """
+        Composite the cached layers of the plot items, rendering
+        again the layers which are out of date
+        
+        With the `QwtPlotCanvas.StaticLayer` paint attribute, the static
+        items below all the other items in z-order are cached into a 
+        single layer, drawn first. Without the `QwtPlotCanvas.LayerCache` 
+        paint attribute, the other items are drawn directly, without being
+        cached.
+        
+        :param QPainter painter: Painter
+        
+        .. seealso::
+        
+            :py:meth:`setPaintAttribute()`, :py:meth:`invalidateLayer()`
+        """
+        from .plot import QwtPlotItem
+        plot = self.plot()
+        canvasRect = self.contentsRect()
+        maps = [plot.canvasMap(axisId) for axisId in plot.validAxes]
+        viewKey = (self.width(), self.height(), canvasRect.getRect(),
+                   tuple([qwtScaleMapKey(m) for m in maps]))
+        static = self.testPaintAttribute(self.StaticLayer)
+        cached = self.testPaintAttribute(self.LayerCache)
+        staticItems = []
+        runs = []
+        for item in plot.itemList():
+            if not item or not item.isVisible():
+                continue
+            if static and not runs and\
+               item.testItemAttribute(QwtPlotItem.Static):
+                staticItems.append(item)
+                continue
+            layer = item.layer() if cached else None
+            if runs and layer is not None and runs[-1][0] == layer:
+                runs[-1][1].append(item)
+            else:
+                runs.append((layer, [item]))
+        if staticItems:
+            runs.insert(0, (None, staticItems))
+        layers = {}
+        dirty = []
+        direct = []
+        for index, (_layer, items) in enumerate(runs):
+            key = tuple(items)
+            if not cached and not (staticItems and index == 0):
+                direct.extend(items)
+                continue
+            entry = self.__data.layers.get(key)
+            if entry is None or entry[0] != viewKey:
+                dirty.append(key)
+            else:
+                layers[key] = entry
+        if dirty or direct:
+            futures = plot.prepareItems([item for key in dirty
+                                         for item in key]+direct,
+                                        canvasRect, maps)
+            if futures is not None:
+                for future in futures:
+                    future.result()
+            for key in dirty:
+                pixmap = QwtPainter.backingStore(self, self.size())
+                pixmap.fill(Qt.transparent)
+                pixmapPainter = QPainter(pixmap)
+                for item in key:
+                    plot.drawItem(pixmapPainter, item, canvasRect, maps)
+                pixmapPainter.end()
+                layers[key] = (viewKey, pixmap)
+        self.__data.layers = layers
+        for _layer, items in runs:
+            entry = layers.get(tuple(items))
+            if entry is None:
+                for item in items:
+                    plot.drawItem(painter, item, canvasRect, maps)
+            else:
+                painter.drawPixmap(0, 0, entry[1])
+    
+    def invalidateLayer(self, item):
+        """
+        Invalidate the cached layer of a plot item: it will be rendered 
+        again on the next paint
+        
+        :param .plot.QwtPlotItem item: Plot item
+        
+        .. seealso::
+        
+            :py:meth:`invalidateLayers()`, :py:meth:`drawLayers()`
+        """
+        layers = self.__data.layers
+        for key in [key for key in layers if item in key]:
+            del layers[key]
+    
+    def invalidateLayers(self):
+        """
+        Invalidate all cached layers
+        
+        .. seealso::
+        
+            :py:meth:`invalidateLayer()`, :py:meth:`drawLayers()`
+        """
+        self.__data.layers = {}
+    
+    def drawAsyncFrame(self, painter):
+        """
+        Draw the last frame rendered in the worker thread, and start
+        rendering a new one if the canvas has been replotted or resized
+        since the last frame was requested
+        
+        :param QPainter painter: Painter
+        
+        .. seealso::
+        
+            :py:meth:`setPaintAttribute()`
+        """
+        frame = self.__data.asyncFrame
+        if self.__data.asyncDirty or frame is None or\
+           frame.size() != self.size():
+            self.__startAsyncRendering()
+        if frame is not None:
+            painter.drawImage(0, 0, frame)
+    
+    def __startAsyncRendering(self):
+        """Start rendering a new frame, unless a frame is being rendered"""
+        if self.__data.asyncThread is not None:
+            return
+        plot = self.plot()
+        self.__data.asyncDirty = False
+        items = [item for item in plot.itemList()
+                 if item and item.isVisible()]
+        canvasRect = self.contentsRect()
+        maps = [plot.canvasMap(axisId) for axisId in plot.validAxes]
+        futures = plot.prepareItems(items, canvasRect, maps)
+        thread = threading.Thread(target=self.__prepareAsyncFrame,
+                                  args=(items, canvasRect, maps, futures))
+        thread.daemon = True
+        self.__data.asyncThread = thread
+        thread.start()
+    
+    def __prepareAsyncFrame(self, items, canvasRect, maps, futures):
+        """
+        Prepare the geometry of the items (worker thread), in parallel 
+        when `futures` is not None (see `QwtPlot.prepareItems()`)
+        """
+        try:
+            for index, item in enumerate(items):
+                if futures is None:
+                    item.prepareGeometry(maps[item.xAxis()],
+                                         maps[item.yAxis()], canvasRect)
+                else:
+                    futures[index].result()
+        finally:
+            try:
+                self.asyncGeometryPrepared.emit()
+            except RuntimeError:
+                #  The canvas has been deleted in the meantime
+                pass
+    
+    def __asyncGeometryPrepared(self):
+        """
+        Record the snapshot of the frame (GUI thread), then rasterize it 
+        in a worker thread
+        """
+        self.__data.asyncThread = None
+        if not self.testPaintAttribute(self.AsyncRendering):
+            return
+        plot = self.plot()
+        maps = [plot.canvasMap(axisId) for axisId in plot.validAxes]
+        #  Snapshot of the frame: drawing commands of the items, recorded
+        #  with the current state of the items
+        picture = QPicture()
+        painter = QPainter(picture)
+        try:
+            plot.drawItems(painter, self.contentsRect(), maps)
+        finally:
+            painter.end()
+        thread = threading.Thread(target=self.__renderAsyncFrame,
+                                  args=(picture, self.size()))
+        thread.daemon = True
+        self.__data.asyncThread = thread
+        thread.start()
+    
+    def __renderAsyncFrame(self, picture, size):
+        """
+        Rasterize the snapshot of a frame into a new image (worker thread):
+        if this fails, the frame is dropped
+        """
+        image = None
+        try:
+            frame = QImage(size, QImage.Format_ARGB32_Premultiplied)
+            frame.fill(Qt.transparent)
+            painter = QPainter(frame)
+            try:
+                painter.drawPicture(0, 0, picture)
+            finally:
+                painter.end()
+            image = frame
+        finally:
+            try:
+                self.asyncFrameRendered.emit(image)
+            except RuntimeError:
+                #  The canvas has been deleted in the meantime
+                pass
+    
+    def __asyncFrameRendered(self, image):
+        """Swap the frame rendered by the worker thread (GUI thread)"""
+        self.__data.asyncThread = None
+        if image is None and not self.__data.asyncDirty:
+            return
+        if image is not None and self.testPaintAttribute(self.AsyncRendering):
+            self.__data.asyncFrame = image
+            self.invalidateBackingStore()
+        self.update(self.contentsRect())
+    
     def drawBorder(self, painter):
         """
         Draw the border of the plot canvas
@@ -742,6 +1047,7 @@ class QwtPlotCanvas(QFrame):
         Invalidate the paint cache and repaint the canvas
         """
         self.invalidateBackingStore()
+        self.__data.asyncDirty = True
         if self.testPaintAttribute(self.ImmediatePaint):
             self.repaint(self.contentsRect())
         else:
@@ -22,11 +22,17 @@ from .plot_series import (QwtPlotSeriesItem, QwtSeriesStore,
                              QwtSeriesData, QwtPointArrayData)
 from .symbol import QwtSymbol
 from .plot_directpainter import QwtPlotDirectPainter
+from .scale_map import qwtScaleMapKey
+from .point_mapper import (array_to_polyline, polyline_to_array,
+                           array_to_steps, array_to_lines,
+                           minmax_decimation, clip_polygon, filter_points,
+                           finite_runs, series_to_image)
 
 from .qt.QtGui import QPen, QBrush, QPainter, QPolygonF, QColor
 from .qt.QtCore import QSize, Qt, QRectF, QPointF
 
 import numpy as np
+import threading
 
 
 def qwtUpdateLegendIconSize(curve):
@@ -54,15 +60,127 @@ def qwtVerifyRange(size, i1, i2):
 def series_to_polyline(xMap, yMap, series, from_, to):
     """
     Convert series data to QPolygon(F) polyline
+    
+    Mapped values are written directly into the buffer of the polyline,
+    whatever the data type of the series arrays.
     """
-    polyline = QPolygonF(to-from_+1)
+    size = to-from_+1
+    if size <= 0:
+        return QPolygonF()
+    polyline = QPolygonF(size)
     pointer = polyline.data()
-    dtype, tinfo = np.float, np.finfo  # integers: = np.int, np.iinfo
-    pointer.setsize(2*polyline.size()*tinfo(dtype).dtype.itemsize)
-    memory = np.frombuffer(pointer, dtype)
-    memory[:(to-from_)*2+1:2] = xMap.transform(series.xData()[from_:to+1])
-    memory[1:(to-from_)*2+2:2] = yMap.transform(series.yData()[from_:to+1])
-    return polyline    
+    pointer.setsize(2*size*np.dtype(np.float64).itemsize)
+    memory = np.frombuffer(pointer, np.float64)
+    xMap.transform_array(series.xData()[from_:to+1], out=memory[0::2])
+    yMap.transform_array(series.yData()[from_:to+1], out=memory[1::2])
+    return polyline
+
+
+def series_to_steps(xMap, yMap, series, from_, to, inverted=False):
+    """
+    Convert series data to QPolygon(F) step polyline
+    
+    Same as :py:func:`qwt.point_mapper.array_to_steps`, mapped values 
+    being written directly into the buffer of the polyline.
+    """
+    size = to-from_+1
+    if size <= 0:
+        return QPolygonF()
+    polyline = QPolygonF(2*size-1)
+    pointer = polyline.data()
+    pointer.setsize(2*(2*size-1)*np.dtype(np.float64).itemsize)
+    memory = np.frombuffer(pointer, np.float64)
+    xs = xMap.transform_array(series.xData()[from_:to+1], out=memory[0::4])
+    ys = yMap.transform_array(series.yData()[from_:to+1], out=memory[1::4])
+    if inverted:
+        memory[2::4] = xs[:-1]
+        memory[3::4] = ys[1:]
+    else:
+        memory[2::4] = xs[1:]
+        memory[3::4] = ys[:-1]
+    return polyline
+
+
+class QwtPlotCurve_PointIndex(object):
+    """
+    Index of the curve points, sorted by x values, used to find the
+    closest curve point of a position without iterating over all points
+    """
+    def __init__(self, xData, yData):
+        order = np.flatnonzero(np.isfinite(xData))
+        xs = xData[order]
+        if xs.size > 1 and np.any(xs[1:] < xs[:-1]):
+            sort = np.argsort(xs, kind='mergesort')
+            order, xs = order[sort], xs[sort]
+        self.order = order
+        self.xData = xs
+        self.yData = yData[order]
+    
+    def closest(self, xMap, yMap, x, y, i0, i1, yInterval=None):
+        """
+        Return the closest point among sorted points `i0` to `i1`-1 
+        (optionally, only points with y values in `yInterval`)
+        """
+        if yInterval is None:
+            indexes = np.arange(i0, i1)
+        else:
+            ys = self.yData[i0:i1]
+            indexes = i0+np.flatnonzero((ys >= yInterval[0]) &
+                                        (ys <= yInterval[1]))
+        dx = xMap.transform(self.xData[indexes])-x
+        dy = yMap.transform(self.yData[indexes])-y
+        dist2 = dx*dx+dy*dy
+        if dist2.size == 0 or np.all(np.isnan(dist2)):
+            return -1, np.inf
+        i = np.nanargmin(dist2)
+        return indexes[i], dist2[i]
+    
+    def closestPoint(self, xMap, yMap, pos):
+        """
+        :return: tuple `(index, dist)`, in the curve sample numbering
+        """
+        size = self.xData.size
+        x, y = pos.x(), pos.y()
+        # Nearest points in x (at least 16, at most 4096 of them, within
+        # one pixel if possible) give an upper bound of the distance...
+        k = np.searchsorted(self.xData, xMap.invTransform(x))
+        x1, x2 = sorted([xMap.invTransform(x-1.), xMap.invTransform(x+1.)])
+        i0 = np.searchsorted(self.xData, x1, side='left')
+        i1 = np.searchsorted(self.xData, x2, side='right')
+        i0 = max([0, k-2048, min([i0, k-16])])
+        i1 = min([size, k+2048, max([i1, k+16])])
+        i, dist2 = self.closest(xMap, yMap, x, y, i0, i1)
+        if i < 0:
+            # ...unless their y values are not finite
+            i, dist2 = self.closest(xMap, yMap, x, y, 0, size)
+        else:
+            # ...and only points with |dx| and |dy| below this bound have
+            # to be tested
+            dist = np.sqrt(dist2)+1.
+            x1, x2 = sorted([xMap.invTransform(x-dist),
+                             xMap.invTransform(x+dist)])
+            i0 = np.searchsorted(self.xData, x1, side='left')
+            i1 = np.searchsorted(self.xData, x2, side='right')
+            yInterval = sorted([yMap.invTransform(y-dist),
+                                yMap.invTransform(y+dist)])
+            j, d2 = self.closest(xMap, yMap, x, y, max([0, i0-1]),
+                                 min([size, i1+1]), yInterval)
+            if j >= 0 and d2 < dist2:
+                i, dist2 = j, d2
+        if i < 0:
+            return -1, np.inf
+        return self.order[i], np.sqrt(dist2)
+
+
+class QwtPlotCurve_DrawState(threading.local):
+    """
+    State of the curve during a call to drawSeries: one per thread, as a 
+    curve may be drawn simultaneously by several threads (e.g. tiles)
+    """
+    def __init__(self):
+        self.cacheKey = None
+        self.fillCount = 0
+        self.series = None
 
 
 class QwtPlotCurve_PrivateData(QwtPlotItem_PrivateData):
@@ -72,9 +190,14 @@ class QwtPlotCurve_PrivateData(QwtPlotItem_PrivateData):
         self.baseline = 0.
         self.symbol = None
         self.attributes = 0
+        self.paintAttributes = 0
         self.legendAttributes = QwtPlotCurve.LegendShowLine
         self.pen = QPen(Qt.black)
         self.brush = QBrush()
+        self.pointIndex = None
+        self.dataVersion = 0
+        self.cache = {}
+        self.drawState = QwtPlotCurve_DrawState()
         
 
 class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
@@ -130,6 +253,49 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
         For `QwtPlotCurve.Steps` only. 
         Draws a step function from the right to the left.
     
+    Paint attributes:
+    
+      * `QwtPlotCurve.MinMaxDecimation`:
+        
+        For `QwtPlotCurve.Lines` only.
+        Reduce the points drawn in each pixel column to the first, the 
+        minimum, the maximum and the last one: the resulting polyline 
+        looks the same as the complete one, but drawing time depends on 
+        the canvas width instead of the number of samples (when x values 
+        are monotonic).
+    
+      * `QwtPlotCurve.ClipPolygons`:
+        
+        Clip polygons before painting them. In situations, where points
+        are far outside the visible area (e.g. when zooming deep) this
+        might be a substantial improvement for the painting performance.
+    
+      * `QwtPlotCurve.FilterPoints`:
+        
+        For `QwtPlotCurve.Dots` and symbols only.
+        Points mapped to the same pixel position are painted only once.
+        For scatter plots with a huge number of points, painting time 
+        then depends on the canvas area instead of the number of points.
+    
+      * `QwtPlotCurve.ImageBuffer`:
+        
+        For `QwtPlotCurve.Dots` only (without brush, antialiasing and with
+        a pen width <= 1). Render points into an image (see 
+        :py:func:`qwt.point_mapper.series_to_image`) which is then drawn 
+        at once. Rendering may be done in parallel, see 
+        :py:meth:`qwt.plot.QwtPlotItem.setRenderThreadCount()`.
+        Note that overlapping semi-transparent points are not blended.
+    
+      * `QwtPlotCurve.LevelOfDetail`:
+        
+        For `QwtPlotCurve.Lines` only, with series data providing a level
+        of detail pyramid (see 
+        :py:meth:`qwt.plot_series.QwtSeriesData.levelOfDetail()`).
+        Draw the coarsest level of the pyramid giving at least 2 blocks 
+        of samples per pixel: drawing time then depends on the canvas 
+        width instead of the number of samples, even for the time taken
+        to reduce the samples.
+    
     Legend attributes:
     
       * `QwtPlotCurve.LegendNoAttribute`:
@@ -168,6 +334,13 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
     # enum CurveAttribute
     Inverted = 0x01
     
+    # enum PaintAttribute
+    MinMaxDecimation = 0x01
+    ClipPolygons = 0x02
+    FilterPoints = 0x04
+    ImageBuffer = 0x08
+    LevelOfDetail = 0x10
+    
     # enum LegendAttribute
     LegendNoAttribute = 0x00
     LegendShowLine = 0x01
@@ -409,6 +582,39 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
         directPainter = QwtPlotDirectPainter(self.plot())
         directPainter.drawSeries(self, from_, to)
         
+    def visibleRange(self, xMap, yMap, canvasRect):
+        """
+        Return the range of samples which may be visible on the canvas
+        
+        The canvas rectangle is enlarged by the pen width and the symbol 
+        size. The range of all samples is returned for user-defined styles,
+        and when samples outside the x-range of the canvas may be visible
+        (sticks or filled area in vertical orientation).
+        
+        :param .scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+        :param .scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+        :param QRectF canvasRect: Contents rectangle of the canvas
+        :return: Tuple (from_, to) of sample indexes, to < 0 meaning the last sample
+        
+        .. seealso::
+        
+            :py:meth:`.plot_series.QwtPlotSeriesItem.visibleRange()`
+        """
+        style = self.__data.style
+        if style not in (self.NoCurve, self.Lines, self.Sticks, self.Steps,
+                         self.Dots):
+            return 0, -1
+        if self.orientation() == Qt.Vertical and (style == self.Sticks or
+                            self.__data.brush.style() != Qt.NoBrush):
+            return 0, -1
+        margin = max([1., self.__data.pen.widthF()])
+        symbol = self.__data.symbol
+        if symbol and symbol.style() != QwtSymbol.NoSymbol:
+            rect = symbol.boundingRect()
+            margin += .5*max([rect.width(), rect.height()])
+        return QwtPlotSeriesItem.visibleRange(self, xMap, yMap, canvasRect,
+                                              margin)
+    
     def drawSeries(self, painter, xMap, yMap, canvasRect, from_, to):
         """
         Draw an interval of the curve
@@ -424,23 +630,167 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
         
             :py:meth:`drawCurve()`, :py:meth:`drawSymbols()`
         """
-        numSamples = self.dataSize()
+        series = self.data()
+        numSamples = series.size()
         if not painter or numSamples <= 0:
             return
         if to < 0:
             to = numSamples-1
         if qwtVerifyRange(numSamples, from_, to) > 0:
-            painter.save()
-            painter.setPen(self.__data.pen)
-            self.drawCurve(painter, self.__data.style, xMap, yMap, canvasRect,
-                           from_, to)
-            painter.restore()
-            if self.__data.symbol and\
-               self.__data.symbol.style() != QwtSymbol.NoSymbol:
+            if self.__data.style in (self.NoCurve, self.Lines, self.Sticks,
+                                     self.Steps, self.Dots):
+                antialiased = painter.testRenderHint(QPainter.Antialiasing)
+                self.__beginGeometry(series, antialiased, xMap, yMap,
+                                     canvasRect, from_, to)
+            try:
                 painter.save()
-                self.drawSymbols(painter, self.__data.symbol,
-                                 xMap, yMap, canvasRect, from_, to)
+                painter.setPen(self.__data.pen)
+                self.drawCurve(painter, self.__data.style, xMap, yMap,
+                               canvasRect, from_, to)
                 painter.restore()
+                if self.__data.symbol and\
+                   self.__data.symbol.style() != QwtSymbol.NoSymbol:
+                    painter.save()
+                    self.drawSymbols(painter, self.__data.symbol,
+                                     xMap, yMap, canvasRect, from_, to)
+                    painter.restore()
+            finally:
+                self.__data.drawState.cacheKey = None
+                self.__data.drawState.series = None
+    
+    def prepareGeometry(self, xMap, yMap, canvasRect):
+        """
+        Prepare the geometry of the curve (polylines, sticks, dots, filled
+        areas and symbol positions), for the next call to :py:meth:`draw()`
+        with the same arguments
+        
+        Nothing is prepared for user-defined styles, whose geometry is 
+        computed when drawing the curve.
+        
+        :param .scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+        :param .scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+        :param QRectF canvasRect: Contents rectangle of the canvas
+        
+        .. seealso::
+        
+            :py:meth:`.plot.QwtPlotItem.prepareGeometry()`
+        """
+        style = self.__data.style
+        if style not in (self.NoCurve, self.Lines, self.Sticks, self.Steps,
+                         self.Dots):
+            return
+        series = self.data()
+        numSamples = series.size()
+        if numSamples <= 0:
+            return
+        from_, to = self.visibleRange(xMap, yMap, canvasRect)
+        if to < 0:
+            to = numSamples-1
+        if qwtVerifyRange(numSamples, from_, to) <= 0:
+            return
+        antialiased = self.testRenderHint(QwtPlotItem.RenderAntialiased)
+        self.__beginGeometry(series, antialiased, xMap, yMap, canvasRect,
+                             from_, to)
+        try:
+            pen = self.__data.pen
+            penWidth = pen.widthF()
+            doFill = self.__data.brush.style() != Qt.NoBrush\
+                     and self.__data.brush.color().alpha() > 0
+            fillPolylines = []
+            if style == self.Lines:
+                polylines, fillPolylines = self.__linesGeometry(
+                                xMap, yMap, canvasRect, from_, to, penWidth)
+            elif style == self.Steps:
+                polylines, fillPolylines = self.__stepsGeometry(
+                                xMap, yMap, canvasRect, from_, to, penWidth)
+                doFill = self.__data.brush.style() != Qt.NoBrush
+            elif style == self.Sticks:
+                self.__sticksGeometry(xMap, yMap, from_, to)
+            elif style == self.Dots:
+                if self.__useImageBuffer(doFill, antialiased, penWidth):
+                    self.__dotsImage(xMap, yMap, canvasRect, from_, to,
+                                     pen.color())
+                else:
+                    polyline, points = self.__dotsGeometry(
+                                xMap, yMap, canvasRect, from_, to, penWidth)
+                    fillPolylines = [polyline]
+            if doFill:
+                for polyline in fillPolylines:
+                    self.__fillGeometry(xMap, yMap, canvasRect,
+                                        QPolygonF(polyline), penWidth)
+            symbol = self.__data.symbol
+            if symbol and symbol.style() != QwtSymbol.NoSymbol:
+                self.__symbolsGeometry(xMap, yMap, from_, to)
+        finally:
+            self.__data.drawState.cacheKey = None
+            self.__data.drawState.series = None
+    
+    def __beginGeometry(self, series, antialiased, xMap, yMap, canvasRect,
+                        from_, to):
+        """
+        Select the cached geometry matching the arguments, for the 
+        geometry computed (or reused) until the end of the current call 
+        to drawSeries or prepareGeometry: this geometry is computed from 
+        `series`, even if the data of the curve is replaced in the meantime
+        (e.g. by the GUI thread, while the geometry is prepared by a 
+        worker thread)
+        """
+        key = self.__geometryKey(series, antialiased, xMap, yMap,
+                                 canvasRect, from_, to)
+        cache = self.__data.cache
+        if any([entry[0] != key for entry in list(cache.values())]):
+            self.__data.cache = dict([(name, entry) for name, entry
+                                      in list(cache.items())
+                                      if entry[0] == key])
+        self.__data.drawState.cacheKey = key
+        self.__data.drawState.fillCount = 0
+        self.__data.drawState.series = series
+    
+    def __geometryKey(self, series, antialiased, xMap, yMap, canvasRect,
+                      from_, to):
+        """
+        Return the key identifying the geometry computed when drawing 
+        the curve: everything it depends on, beside the samples themselves
+        """
+        pen = self.__data.pen
+        return (id(series), self.__data.dataVersion, from_, to,
+                qwtScaleMapKey(xMap), qwtScaleMapKey(yMap),
+                canvasRect.getRect(), self.__data.style, self.orientation(),
+                self.__data.attributes, self.__data.paintAttributes,
+                self.__data.baseline, pen.widthF(), pen.color().rgba(),
+                antialiased, self.renderThreadCount())
+    
+    def __series(self):
+        """
+        Return the series the geometry is computed from, during the 
+        current call to drawSeries or prepareGeometry
+        """
+        series = self.__data.drawState.series
+        if series is None:
+            return self.data()
+        return series
+    
+    def __cachedGeometry(self, name):
+        """
+        Return geometry cached by a previous call to drawSeries or 
+        prepareGeometry, when it may be reused for the current one, 
+        None otherwise
+        """
+        key = self.__data.drawState.cacheKey
+        entry = self.__data.cache.get(name)
+        if key is not None and entry is not None:
+            cachedKey, geometry = entry
+            if cachedKey == key:
+                return geometry
+    
+    def __cacheGeometry(self, name, geometry):
+        """
+        Cache geometry computed during the current call to drawSeries or
+        prepareGeometry
+        """
+        key = self.__data.drawState.cacheKey
+        if key is not None:
+            self.__data.cache[name] = (key, geometry)
     
     def drawCurve(self, painter, style, xMap, yMap, canvasRect, from_, to):
         """
@@ -488,10 +838,65 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
             return
         doFill = self.__data.brush.style() != Qt.NoBrush\
                  and self.__data.brush.color().alpha() > 0
-        polyline = series_to_polyline(xMap, yMap, self.data(), from_, to)
-        painter.drawPolyline(polyline)
+        polylines, fillPolylines = self.__linesGeometry(xMap, yMap,
+                                canvasRect, from_, to, painter.pen().widthF())
+        for polyline in polylines:
+            painter.drawPolyline(polyline)
         if doFill:
-            self.fillCurve(painter, xMap, yMap, canvasRect, polyline)
+            for polyline in fillPolylines:
+                self.fillCurve(painter, xMap, yMap, canvasRect,
+                               QPolygonF(polyline))
+    
+    def __linesGeometry(self, xMap, yMap, canvasRect, from_, to, penWidth):
+        """
+        Return the polylines drawn by drawLines, and the polylines to be
+        filled: the latter are not clipped, since clipping an open
+        polyline would move the ends of the area closed by fillCurve
+        """
+        geometry = self.__cachedGeometry('polylines')
+        if geometry is not None:
+            return geometry
+        series = self.__series()
+        attributes = self.__data.paintAttributes
+        pyramid = None
+        if attributes & self.LevelOfDetail:
+            pyramid = series.levelOfDetail()
+        if pyramid is not None:
+            xData, yData = series.xData(), series.yData()
+            width = abs(xMap.transform(xData[to])-
+                        xMap.transform(xData[from_]))
+            if not np.isfinite(width):
+                width = canvasRect.width()
+            xs, ys = pyramid.decimate(xData, yData, from_, to,
+                                      int(2*width)+1)
+            polyline = array_to_polyline(xMap.transform(xs),
+                                         yMap.transform(ys))
+        else:
+            polyline = series_to_polyline(xMap, yMap, series, from_, to)
+        # Views on the polyline buffer: no copy of the mapped values
+        xs, ys = polyline_to_array(polyline, copy=False)
+        starts, ends = finite_runs(xs, ys)
+        if starts.size == 1 and ends[0]-starts[0] == xs.size and\
+           not attributes & (self.MinMaxDecimation|self.ClipPolygons):
+            starts, ends = [], []
+            polylines = fillPolylines = [polyline]
+        else:
+            polylines, fillPolylines = [], []
+        for start, end in zip(starts, ends):
+            runXs, runYs = xs[start:end], ys[start:end]
+            if attributes & self.MinMaxDecimation:
+                indexes = minmax_decimation(runXs, runYs)
+                runXs, runYs = runXs[indexes], runYs[indexes]
+            run = array_to_polyline(runXs, runYs)
+            fillPolylines.append(run)
+            if attributes & self.ClipPolygons:
+                pw = max([1., penWidth])
+                clipRect = QRectF(canvasRect).adjusted(-pw, -pw, pw, pw)
+                run = array_to_polyline(*clip_polygon(runXs, runYs,
+                                                      clipRect, False))
+            polylines.append(run)
+        self.__cacheGeometry('polylines', (polylines, fillPolylines))
+        return polylines, fillPolylines
     
     def drawSticks(self, painter, xMap, yMap, canvasRect, from_, to):
         """
@@ -511,19 +916,29 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
         """
         painter.save()
         painter.setRenderHint(QPainter.Antialiasing, False)
+        QwtPainter.drawLines(painter,
+                             self.__sticksGeometry(xMap, yMap, from_, to))
+        painter.restore()
+    
+    def __sticksGeometry(self, xMap, yMap, from_, to):
+        """Return the point pairs of the lines drawn by drawSticks"""
+        lines = self.__cachedGeometry('lines')
+        if lines is not None:
+            return lines
         x0 = xMap.transform(self.__data.baseline)
         y0 = yMap.transform(self.__data.baseline)
-        o = self.orientation()
-        series = self.data()
-        for i in range(from_, to+1):
-            sample = series.sample(i)
-            xi = xMap.transform(sample.x())
-            yi = yMap.transform(sample.y())
-            if o == Qt.Horizontal:
-                painter.drawLine(xi, y0, xi, yi)
-            else:
-                painter.drawLine(x0, yi, xi, yi)
-        painter.restore()
+        series = self.__series()
+        xs = xMap.transform(series.xData()[from_:to+1])
+        ys = yMap.transform(series.yData()[from_:to+1])
+        finite = np.isfinite(xs) & np.isfinite(ys)
+        if not finite.all():
+            xs, ys = xs[finite], ys[finite]
+        if self.orientation() == Qt.Horizontal:
+            lines = array_to_lines(xs, y0, xs, ys)
+        else:
+            lines = array_to_lines(x0, ys, xs, ys)
+        self.__cacheGeometry('lines', lines)
+        return lines
         
     def drawDots(self, painter, xMap, yMap, canvasRect, from_, to):
         """
@@ -543,10 +958,69 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
         """
         doFill = self.__data.brush.style() != Qt.NoBrush\
                  and self.__data.brush.color().alpha() > 0
-        polyline = series_to_polyline(xMap, yMap, self.data(), from_, to)
-        painter.drawPoints(polyline)
+        penWidth = painter.pen().widthF()
+        if self.__useImageBuffer(doFill,
+                                 painter.testRenderHint(QPainter.Antialiasing),
+                                 penWidth):
+            rect, image = self.__dotsImage(xMap, yMap, canvasRect, from_, to,
+                                           painter.pen().color())
+            painter.drawImage(rect.topLeft(), image)
+            return
+        polyline, points = self.__dotsGeometry(xMap, yMap, canvasRect,
+                                               from_, to, penWidth)
+        painter.drawPoints(points)
         if doFill:
-            self.fillCurve(painter, xMap, yMap, canvasRect, polyline)
+            self.fillCurve(painter, xMap, yMap, canvasRect,
+                           QPolygonF(polyline))
+    
+    def __useImageBuffer(self, doFill, antialiased, penWidth):
+        """Return True if dots are drawn into an image (see ImageBuffer)"""
+        return bool(self.__data.paintAttributes & self.ImageBuffer)\
+               and not doFill and not antialiased and penWidth <= 1.
+    
+    def __dotsImage(self, xMap, yMap, canvasRect, from_, to, color):
+        """
+        Return the aligned canvas rectangle, and the image of the dots 
+        drawn by drawDots with the ImageBuffer paint attribute
+        """
+        rect = QRectF(canvasRect).toAlignedRect()
+        image = self.__cachedGeometry('image')
+        if image is None:
+            image = series_to_image(xMap, yMap, self.__series(), from_, to,
+                                    rect, color, self.renderThreadCount())
+            self.__cacheGeometry('image', image)
+        return rect, image
+    
+    def __dotsGeometry(self, xMap, yMap, canvasRect, from_, to, penWidth):
+        """
+        Return the polyline of the samples (to be filled), and the points 
+        drawn by drawDots
+        """
+        attributes = self.__data.paintAttributes
+        polyline = self.__cachedGeometry('polyline')
+        if polyline is None:
+            polyline = series_to_polyline(xMap, yMap, self.__series(), from_,
+                                          to)
+            self.__cacheGeometry('polyline', polyline)
+        if not attributes & (self.ClipPolygons|self.FilterPoints):
+            return polyline, polyline
+        points = self.__cachedGeometry('points')
+        if points is None:
+            xs, ys = polyline_to_array(polyline)
+            if attributes & self.ClipPolygons:
+                pw = max([1., penWidth])
+                clipRect = QRectF(canvasRect).adjusted(-pw, -pw, pw, pw)
+                inside = (xs >= clipRect.left()) &\
+                         (xs <= clipRect.right()) &\
+                         (ys >= clipRect.top()) &\
+                         (ys <= clipRect.bottom())
+                xs, ys = xs[inside], ys[inside]
+            if attributes & self.FilterPoints:
+                indexes = filter_points(xs, ys)
+                xs, ys = xs[indexes], ys[indexes]
+            points = array_to_polyline(xs, ys)
+            self.__cacheGeometry('points', points)
+        return polyline, points
     
     def drawSteps(self, painter, xMap, yMap, canvasRect, from_, to):
         """
@@ -564,27 +1038,49 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
             :py:meth:`draw()`, :py:meth:`drawSticks()`, 
             :py:meth:`drawDots()`, :py:meth:`drawLines()`
         """
-        polygon = QPolygonF(2*(to-from_)+1)
+        polygons, fillPolygons = self.__stepsGeometry(xMap, yMap,
+                                canvasRect, from_, to, painter.pen().widthF())
+        for polygon in polygons:
+            painter.drawPolyline(polygon)
+        if self.__data.brush.style() != Qt.NoBrush:
+            for polygon in fillPolygons:
+                self.fillCurve(painter, xMap, yMap, canvasRect,
+                               QPolygonF(polygon))
+    
+    def __stepsGeometry(self, xMap, yMap, canvasRect, from_, to, penWidth):
+        """
+        Return the polylines drawn by drawSteps, and the (unclipped)
+        polylines to be filled
+        """
+        geometry = self.__cachedGeometry('polylines')
+        if geometry is not None:
+            return geometry
         inverted = self.orientation() == Qt.Vertical
         if self.__data.attributes & self.Inverted:
             inverted = not inverted
-        series = self.data()
-        ip = 0
-        for i in range(from_, to+1):
-            sample = series.sample(i)
-            xi = xMap.transform(sample.x())
-            yi = yMap.transform(sample.y())
-            if ip > 0:
-                p0 = polygon[ip-2]
-                if inverted:
-                    polygon[ip-1] = QPointF(p0.x(), yi)
-                else:
-                    polygon[ip-1] = QPointF(xi, p0.y())
-            polygon[ip] = QPointF(xi, yi)
-            ip += 2
-        painter.drawPolyline(polygon)
-        if self.__data.brush.style() != Qt.NoBrush:
-            self.fillCurve(painter, xMap, yMap, canvasRect, polygon)
+        polygon = series_to_steps(xMap, yMap, self.__series(), from_, to,
+                                  inverted)
+        # Views on the mapped samples of the polygon buffer
+        xs, ys = polyline_to_array(polygon, copy=False)
+        xs, ys = xs[0::2], ys[0::2]
+        starts, ends = finite_runs(xs, ys)
+        if starts.size == 1 and ends[0]-starts[0] == xs.size:
+            runs = [polygon]
+        else:
+            runs = [array_to_steps(xs[start:end], ys[start:end],
+                                   inverted)
+                    for start, end in zip(starts, ends)]
+        polygons = runs
+        if self.__data.paintAttributes & self.ClipPolygons:
+            pw = max([1., penWidth])
+            clipRect = QRectF(canvasRect).adjusted(-pw, -pw, pw, pw)
+            polygons = []
+            for polygon in runs:
+                stepXs, stepYs = polyline_to_array(polygon)
+                polygons.append(array_to_polyline(*clip_polygon(
+                                        stepXs, stepYs, clipRect, False)))
+        self.__cacheGeometry('polylines', (polygons, runs))
+        return polygons, runs
     
     def setCurveAttribute(self, attribute, on=True):
         """
@@ -619,6 +1115,43 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
         """
         return self.__data.attributes & attribute
     
+    def setPaintAttribute(self, attribute, on=True):
+        """
+        Specify an attribute how to draw the curve
+        
+        Supported paint attributes:
+
+            * `QwtPlotCurve.MinMaxDecimation`
+            * `QwtPlotCurve.ClipPolygons`
+            * `QwtPlotCurve.FilterPoints`
+            * `QwtPlotCurve.ImageBuffer`
+            * `QwtPlotCurve.LevelOfDetail`
+
+        :param int attribute: Paint attribute
+        :param bool on: On/Off
+        
+        .. seealso::
+        
+            :py:meth:`testPaintAttribute()`
+        """
+        if bool(self.__data.paintAttributes & attribute) == on:
+            return
+        if on:
+            self.__data.paintAttributes |= attribute
+        else:
+            self.__data.paintAttributes &= ~attribute
+        self.itemChanged()
+    
+    def testPaintAttribute(self, attribute):
+        """
+        :return: True, if attribute is enabled
+        
+        .. seealso::
+        
+            :py:meth:`setPaintAttribute()`
+        """
+        return self.__data.paintAttributes & attribute
+    
     def fillCurve(self, painter, xMap, yMap, canvasRect, polygon):
         """
         Fill the area between the curve and the baseline with
@@ -637,7 +1170,8 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
         """
         if self.__data.brush.style() == Qt.NoBrush:
             return
-        self.closePolyline(painter, xMap, yMap, polygon)
+        polygon = self.__fillGeometry(xMap, yMap, canvasRect, polygon,
+                                      painter.pen().widthF())
         if polygon.count() <= 2:
             return
         brush = self.__data.brush
@@ -649,6 +1183,27 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
         painter.drawPolygon(polygon)
         painter.restore()
     
+    def __fillGeometry(self, xMap, yMap, canvasRect, polygon, penWidth):
+        """
+        Return the polygon filled by fillCurve: the polygon is closed 
+        (see closePolyline), then clipped
+        """
+        name = ('fill', self.__data.drawState.fillCount)
+        self.__data.drawState.fillCount += 1
+        cached = self.__cachedGeometry(name)
+        if cached is not None:
+            return cached
+        self.closePolyline(None, xMap, yMap, polygon)
+        if polygon.count() > 2 and\
+           self.__data.paintAttributes & self.ClipPolygons:
+            pw = max([1., penWidth])
+            clipRect = QRectF(canvasRect).adjusted(-pw, -pw, pw, pw)
+            xs, ys = polyline_to_array(polygon)
+            polygon = array_to_polyline(*clip_polygon(xs, ys, clipRect,
+                                                      True))
+        self.__cacheGeometry(name, polygon)
+        return polygon
+    
     def closePolyline(self, painter, xMap, yMap, polygon):
         """
         Complete a polygon to be a closed polygon including the 
@@ -692,12 +1247,34 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
             :py:meth:`setSymbol()`, :py:meth:`drawSeries()`, 
             :py:meth:`drawCurve()`
         """
+        for points in self.__symbolsGeometry(xMap, yMap, from_, to):
+            symbol.drawSymbols(painter, points)
+    
+    def __symbolsGeometry(self, xMap, yMap, from_, to):
+        """Return the chunks of symbol positions drawn by drawSymbols"""
+        chunks = self.__cachedGeometry('symbols')
+        if chunks is not None:
+            return chunks
         chunkSize = 500
-        for i in range(from_, to+1, chunkSize):
-            n = min([chunkSize, to-i+1])
-            points = series_to_polyline(xMap, yMap, self.data(), i, i+n-1)
-            if points.size() > 0:
-                symbol.drawSymbols(painter, points)
+        chunks = []
+        if self.__data.paintAttributes & self.FilterPoints:
+            series = self.__series()
+            xs = xMap.transform(series.xData()[from_:to+1])
+            ys = yMap.transform(series.yData()[from_:to+1])
+            indexes = filter_points(xs, ys)
+            xs, ys = xs[indexes], ys[indexes]
+            for i in range(0, xs.size, chunkSize):
+                chunks.append(array_to_polyline(xs[i:i+chunkSize],
+                                                ys[i:i+chunkSize]))
+        else:
+            for i in range(from_, to+1, chunkSize):
+                n = min([chunkSize, to-i+1])
+                points = series_to_polyline(xMap, yMap, self.__series(),
+                                            i, i+n-1)
+                if points.size() > 0:
+                    chunks.append(points)
+        self.__cacheGeometry('symbols', chunks)
+        return chunks
     
     def setBaseline(self, value):
         """
@@ -747,8 +1324,10 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
         
         .. note::
         
-            `closestPoint()` implements a dumb algorithm, that iterates
-            over all points
+            For large curves, `closestPoint()` uses an index of the points 
+            sorted by x values, built on first call and invalidated when 
+            data changes (see :py:meth:`dataChanged()`): only points
+            close to the position along the x axis are tested
         """
         numSamples = self.dataSize()
         if self.plot() is None or numSamples <= 0:
@@ -756,18 +1335,40 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
         series = self.data()
         xMap = self.plot().canvasMap(self.xAxis())
         yMap = self.plot().canvasMap(self.yAxis())
-        index = -1
-        dmin = 1.0e10
-        for i in range(numSamples):
-            sample = series.sample(i)
-            cx = xMap.transform(sample.x())-pos.x()
-            cy = yMap.transform(sample.y())-pos.y()
+        if numSamples < 1000:
+            cx = xMap.transform(series.xData()[:numSamples])-pos.x()
+            cy = yMap.transform(series.yData()[:numSamples])-pos.y()
             f = qwtSqr(cx)+qwtSqr(cy)
-            if f < dmin:
-                index = i
-                dmin = f
-        dist = np.sqrt(dmin)
-        return index, dist
+            if np.all(np.isnan(f)):
+                return -1, np.sqrt(1.0e10)
+            index = int(np.nanargmin(f))
+            return index, np.sqrt(f[index])
+        if self.__data.pointIndex is None:
+            self.__data.pointIndex = QwtPlotCurve_PointIndex(
+                        series.xData()[:numSamples], series.yData()[:numSamples])
+        index, dist = self.__data.pointIndex.closestPoint(xMap, yMap, pos)
+        if index < 0:
+            return -1, np.sqrt(1.0e10)
+        return int(index), dist
+    
+    def dataChanged(self):
+        """
+        Notify that the data has been changed: the geometry cached when
+        drawing the curve, the index of the points used by 
+        :py:meth:`closestPoint()` and the information cached by the 
+        series (see :py:meth:`.plot_series.QwtSeriesData.invalidate()`) 
+        are invalidated, and the curve is repainted
+        
+        .. note::
+        
+            Has to be called after modifying the data in place
+        """
+        self.__data.pointIndex = None
+        self.__data.dataVersion += 1
+        self.__data.cache = {}
+        if self.data() is not None:
+            self.data().invalidate()
+        QwtPlotSeriesItem.dataChanged(self)
     
     def legendIcon(self, index, size):
         """
@@ -822,19 +1423,20 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
             :param data: Series data (e.g. `QwtPointArrayData` instance)
             :type data: .plot_series.QwtSeriesData
 
-        .. py:method:: setData(xData, yData, [size=None], [finite=True]):
+        .. py:method:: setData(xData, yData, [size=None], [finite=True], [copy=True]):
 
             Initialize data with `x` and `y` arrays.
             
             This signature was removed in Qwt6 and is temporarily maintained here to ensure compatibility with Qwt5.
     
-            Same as `setSamples(x, y, [size=None], [finite=True])`
+            Same as `setSamples(x, y, [size=None], [finite=True], [copy=True])`
         
             :param x: List/array of x values
             :param y: List/array of y values
             :param size: size of xData and yData
             :type size: int or None
-            :param bool finite: if True, keep only finite array elements (remove all infinity and not a number values), otherwise do not filter array elements
+            :param bool finite: if True, keep only finite array elements (remove all infinity and not a number values), otherwise do not filter array elements (non-finite values are then drawn as gaps)
+            :param bool copy: if False, arrays without non-finite elements are not copied (changes made to them in place are then drawn after calling `dataChanged()`)
         
         .. seealso::
         
@@ -864,15 +1466,16 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
         
             :param samples: List/array of points
         
-        .. py:method:: setSamples(xData, yData, [size=None], [finite=True]):
+        .. py:method:: setSamples(xData, yData, [size=None], [finite=True], [copy=True]):
 
-            Same as `setData(QwtPointArrayData(xData, yData, [size=None]))`
+            Same as `setData(QwtPointArrayData(xData, yData, [size=None], [finite=True], [copy=True]))`
         
             :param xData: List/array of x values
             :param yData: List/array of y values
             :param size: size of xData and yData
             :type size: int or None
-            :param bool finite: if True, keep only finite array elements (remove all infinity and not a number values), otherwise do not filter array elements
+            :param bool finite: if True, keep only finite array elements (remove all infinity and not a number values), otherwise do not filter array elements (non-finite values are then drawn as gaps)
+            :param bool copy: if False, arrays without non-finite elements are not copied (changes made to them in place are then drawn after calling `dataChanged()`)
         
         .. seealso::
         
@@ -893,7 +1496,11 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
             try:
                 finite = kwargs.pop('finite')
             except KeyError:
-                finite = None
+                finite = True
+            try:
+                copy = kwargs.pop('copy')
+            except KeyError:
+                copy = True
             if kwargs:
                 raise TypeError("%s().setSamples(): unknown %s keyword "\
                                 "argument(s)"\
@@ -904,8 +1511,8 @@ class QwtPlotCurve(QwtPlotSeriesItem, QwtSeriesStore):
                     finite = arg
                 elif isinstance(arg, int):
                     size = arg
-            self.setData(QwtPointArrayData(xData, yData,
-                                           size=size, finite=finite))
+            self.setData(QwtPointArrayData(xData, yData, size=size,
+                                           finite=finite, copy=copy))
         else:
             raise TypeError("%s().setSamples() takes 1, 2 or 3 argument(s) "\
                             "(%s given)" % (self.__class__.__name__, len(args)))
@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# Copyright (c) 2002 Uwe Rathmann, for the original C++ code
+# Copyright (c) 2015 Pierre Raybaut, for the Python translation/optimization
+# (see LICENSE file for more details)
+
+"""
+QwtPlotMultiCurve
+-----------------
+
+.. autoclass:: QwtPlotMultiCurve
+   :members:
+"""
+
+from .plot import QwtPlotItem
+from .text import QwtText
+from .graphic import QwtGraphic
+from .legend import QwtLegendData
+from .plot_series import qwtFiniteBounds, qwtRangeOfInterest, qwtRangeRect
+from .scale_map import qwtScaleMapKey
+from .point_mapper import array_to_polyline, finite_runs
+
+from .qt.QtGui import QPen, QPainter, QPolygonF
+from .qt.QtCore import Qt, QRectF
+
+import numpy as np
+
+
+class QwtPlotMultiCurve_PrivateData(object):
+    def __init__(self):
+        self.x = np.array([])
+        self.y = np.zeros((0, 0))
+        self.pen = QPen()
+        self.pens = {}
+        self.titles = []
+        self.boundingRect = None
+        self.increasing = None
+        self.cache = None
+
+
+class QwtPlotMultiCurve(QwtPlotItem):
+    """
+    A plot item, that represents several curves sharing the same abscissa
+
+    The x values are stored once, as a 1-D array, and the y values of all
+    curves as a single 2-D array (one row per curve). When drawing the
+    item, the x values are mapped only once and the polylines of all
+    curves are built from this common mapping: this is much faster than
+    attaching one `QwtPlotCurve` per row when displaying many channels
+    on a common time base. Polylines are cached, and reused as long as
+    data and scale maps are unchanged.
+
+    Each row has its own pen and its own entry on the legend. Not a number
+    values are drawn as gaps.
+
+    .. py:class:: QwtPlotMultiCurve([title=None])
+
+        Constructor
+
+        :param title: Title of the item
+        :type title: .text.QwtText or str
+    """
+
+    def __init__(self, title=None):
+        QwtPlotItem.__init__(self, title)
+        self.__data = QwtPlotMultiCurve_PrivateData()
+        self.setItemAttribute(QwtPlotItem.Legend)
+        self.setItemAttribute(QwtPlotItem.AutoScale)
+        self.setZ(20.)
+
+    def rtti(self):
+        """:return: `QwtPlotItem.Rtti_PlotMultiCurve`"""
+        return QwtPlotItem.Rtti_PlotMultiCurve
+
+    def setData(self, x, y):
+        """
+        Initialize data with a common array of x values and a 2-D array
+        of y values
+
+        Arrays are stored without being copied.
+
+        :param x: x values (if None, sample indexes are used)
+        :type x: numpy.array or None
+        :param numpy.array y: y values, of shape (number of curves, number of samples): a 1-D array is handled as a single curve
+
+        .. seealso::
+
+            :py:meth:`xData()`, :py:meth:`yData()`
+        """
+        y = np.asarray(y)
+        if y.ndim == 1:
+            y = y.reshape(1, y.size)
+        if y.ndim != 2:
+            raise ValueError("y must be a 2-D array")
+        if x is None:
+            x = np.arange(y.shape[1])
+        x = np.asarray(x)
+        if x.ndim != 1 or x.size != y.shape[1]:
+            raise ValueError("x size must match the number of columns of y")
+        self.__data.x = x
+        self.__data.y = y
+        self.dataChanged()
+
+    def dataChanged(self):
+        """
+        Notify that the values of the arrays have changed
+
+        Cached bounds are reset and the plot is updated.
+        """
+        self.__data.boundingRect = None
+        self.__data.increasing = None
+        self.__data.cache = None
+        self.legendChanged()
+        self.itemChanged()
+
+    def xData(self):
+        """
+        :return: Array of the x values shared by all curves
+        """
+        return self.__data.x
+
+    def yData(self):
+        """
+        :return: 2-D array of the y values (one row per curve)
+        """
+        return self.__data.y
+
+    def curveCount(self):
+        """
+        :return: Number of curves (rows of the y array)
+        """
+        return self.__data.y.shape[0]
+
+    def sampleCount(self):
+        """
+        :return: Number of samples of each curve
+        """
+        return self.__data.x.size
+
+    def setPen(self, *args):
+        """
+        Build and/or assign a pen
+
+        .. py:method:: setPen(pen, [index=None])
+
+            Assign a pen
+
+            :param QPen pen: New pen
+            :param index: Curve index (if None, the pen is assigned to all curves)
+            :type index: int or None
+
+        .. py:method:: setPen(color, width, style, [index=None])
+
+            Build and assign a pen
+
+            :param QColor color: Pen color
+            :param float width: Pen width
+            :param Qt.PenStyle style: Pen style
+            :param index: Curve index (if None, the pen is assigned to all curves)
+            :type index: int or None
+
+        .. seealso::
+
+            :py:meth:`pen()`
+        """
+        if len(args) in (3, 4):
+            color, width, style = args[:3]
+            pen = QPen(color, width, style)
+            index = args[3] if len(args) == 4 else None
+        elif len(args) in (1, 2):
+            pen = args[0]
+            index = args[1] if len(args) == 2 else None
+        else:
+            raise TypeError("%s().setPen() takes 1, 2, 3 or 4 argument(s) "\
+                            "(%s given)" % (self.__class__.__name__, len(args)))
+        if index is None:
+            self.__data.pen = pen
+            self.__data.pens = {}
+        else:
+            self.__data.pens[index] = pen
+        self.legendChanged()
+        self.itemChanged()
+
+    def pen(self, index=None):
+        """
+        :param index: Curve index (if None, return the pen common to all curves)
+        :type index: int or None
+        :return: Pen used to draw the lines
+
+        .. seealso::
+
+            :py:meth:`setPen()`
+        """
+        if index is None:
+            return self.__data.pen
+        return self.__data.pens.get(index, self.__data.pen)
+
+    def setCurveTitles(self, titles):
+        """
+        Set the titles of the curves, displayed on the legend
+
+        :param list titles: List of titles (`QwtText` or str)
+
+        .. seealso::
+
+            :py:meth:`curveTitle()`
+        """
+        self.__data.titles = [QwtText(title) if not isinstance(title, QwtText)
+                              else title for title in titles]
+        self.legendChanged()
+
+    def curveTitle(self, index):
+        """
+        :param int index: Curve index
+        :return: Title of the curve: if not set, the title of the item followed by the curve index
+
+        .. seealso::
+
+            :py:meth:`setCurveTitles()`
+        """
+        if index < len(self.__data.titles):
+            return self.__data.titles[index]
+        title = self.title().text()
+        return QwtText(("%s %d" % (title, index)).strip())
+
+    def boundingRect(self):
+        """
+        :return: Bounding rectangle of all curves (cached until the next call to :py:meth:`dataChanged()`)
+        """
+        if self.__data.boundingRect is None:
+            x, y = self.__data.x, self.__data.y
+            if y.size == 0:
+                rect = QRectF(1.0, 1.0, -2.0, -2.0)  # invalid
+            else:
+                rect = qwtRangeRect(qwtFiniteBounds(x),
+                                    qwtFiniteBounds(y.ravel()))
+            self.__data.boundingRect = rect
+        return self.__data.boundingRect
+
+    def visibleRange(self, xMap, canvasRect, margin=0.):
+        """
+        Return the range of samples which may be visible on the canvas
+
+        :param .scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+        :param QRectF canvasRect: Contents rectangle of the canvas
+        :param float margin: Margin around `canvasRect`, in pixels
+        :return: Tuple (from_, to) of sample indexes
+        """
+        x = self.__data.x
+        if self.__data.increasing is None:
+            self.__data.increasing = bool(np.all(x[1:] >= x[:-1]))
+        if not self.__data.increasing:
+            return 0, x.size-1
+        x1 = xMap.invTransform(canvasRect.left()-margin)
+        x2 = xMap.invTransform(canvasRect.right()+margin)
+        rect = QRectF(min([x1, x2]), 0., abs(x2-x1), 0.)
+        return qwtRangeOfInterest(x, rect)
+
+    def draw(self, painter, xMap, yMap, canvasRect):
+        """
+        Draw the curves
+
+        The x values of the visible range are mapped once, then the
+        polyline of each curve is built by copying them and mapping the
+        y values of the curve directly into the buffer of the polyline.
+
+        :param QPainter painter: Painter
+        :param .scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+        :param .scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+        :param QRectF canvasRect: Contents rectangle of the canvas
+        """
+        painter.save()
+        for index, polylines in self.__geometry(xMap, yMap, canvasRect):
+            painter.setPen(self.pen(index))
+            for polyline in polylines:
+                painter.drawPolyline(polyline)
+        painter.restore()
+
+    def prepareGeometry(self, xMap, yMap, canvasRect):
+        """
+        Prepare the polylines of the curves, for the next call to
+        :py:meth:`draw()` with the same arguments
+
+        :param .scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+        :param .scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+        :param QRectF canvasRect: Contents rectangle of the canvas
+
+        .. seealso::
+
+            :py:meth:`.plot.QwtPlotItem.prepareGeometry()`
+        """
+        self.__geometry(xMap, yMap, canvasRect)
+
+    def __geometry(self, xMap, yMap, canvasRect):
+        """
+        Return the list of (curve index, polylines) tuples to be drawn,
+        curves drawn without pen being skipped
+        """
+        x, y = self.__data.x, self.__data.y
+        if x.size == 0 or y.size == 0:
+            return []
+        pens = [self.pen(index) for index in range(y.shape[0])]
+        margin = max([1.]+[pen.widthF() for pen in pens])
+        from_, to = self.visibleRange(xMap, canvasRect, margin)
+        if to < from_:
+            return []
+        key = (from_, to, qwtScaleMapKey(xMap), qwtScaleMapKey(yMap))
+        if self.__data.cache is None or self.__data.cache[0] != key:
+            self.__data.cache = (key, {})
+        cache = self.__data.cache[1]
+        xs = None
+        geometry = []
+        for index, pen in enumerate(pens):
+            if pen.style() == Qt.NoPen:
+                continue
+            polylines = cache.get(index)
+            if polylines is None:
+                if xs is None:
+                    xs = xMap.transform_array(x[from_:to+1])
+                polylines = self.__polylines(xs, yMap, y[index, from_:to+1])
+                cache[index] = polylines
+            geometry.append((index, polylines))
+        return geometry
+
+    def __polylines(self, xs, yMap, y):
+        """
+        Return the polylines of a curve, from mapped x values and y values
+        (one polyline per run of finite values)
+        """
+        size = xs.size
+        polyline = QPolygonF(size)
+        pointer = polyline.data()
+        pointer.setsize(2*size*np.dtype(np.float64).itemsize)
+        memory = np.frombuffer(pointer, np.float64)
+        memory[0::2] = xs
+        ys = yMap.transform_array(y, out=memory[1::2])
+        starts, ends = finite_runs(xs, ys)
+        if starts.size == 1 and ends[0]-starts[0] == size:
+            return [polyline]
+        return [array_to_polyline(xs[start:end], ys[start:end])
+                for start, end in zip(starts, ends)]
+
+    def legendData(self):
+        """
+        :return: One legend entry per curve
+
+        .. seealso::
+
+            :py:meth:`curveTitle()`, :py:meth:`legendIcon()`
+        """
+        entries = []
+        for index in range(self.curveCount()):
+            data = QwtLegendData()
+            label = self.curveTitle(index)
+            label.setRenderFlags(label.renderFlags() & Qt.AlignLeft)
+            data.setValue(QwtLegendData.TitleRole, label)
+            graphic = self.legendIcon(index, self.legendIconSize())
+            if not graphic.isNull():
+                data.setValue(QwtLegendData.IconRole, graphic)
+            entries.append(data)
+        return entries
+
+    def legendIcon(self, index, size):
+        """
+        :param int index: Index of the legend entry (curve index)
+        :param QSizeF size: Icon size
+        :return: Icon representing the curve on the legend (a line drawn with the pen of the curve)
+
+        .. seealso::
+
+            :py:meth:`.plot.QwtPlotItem.setLegendIconSize()`,
+            :py:meth:`.plot.QwtPlotItem.legendData()`
+        """
+        if size.isEmpty():
+            return QwtGraphic()
+        graphic = QwtGraphic()
+        graphic.setDefaultSize(size)
+        graphic.setRenderHint(QwtGraphic.RenderPensUnscaled, True)
+        pen = self.pen(index)
+        if pen.style() != Qt.NoPen:
+            painter = QPainter(graphic)
+            painter.setRenderHint(QPainter.Antialiasing,
+                          self.testRenderHint(QwtPlotItem.RenderAntialiased))
+            painter.setPen(pen)
+            y = .5*size.height()
+            painter.drawLine(0., y, size.width(), y)
+            painter.end()
+        return graphic
@@ -206,6 +206,10 @@ class QwtPlotRenderer(QObject):
 
         The format of the document will be auto-detected from the
         suffix of the file name.
+        
+        When exporting to an image format (e.g. PNG), the canvas is 
+        rendered in parallel tiles if the plot has more than one tile
+        (see :py:meth:`.plot.QwtPlot.setTileCount()`).
   
         :param .plot.QwtPlot plot: Plot widget
         :param str fileName: Path of the file, where the document will be stored
@@ -21,12 +21,42 @@ QwtSeriesData
 .. autoclass:: QwtSeriesData
    :members:
    
+QwtMinMaxIndex
+~~~~~~~~~~~~~~
+
+.. autoclass:: QwtMinMaxIndex
+   :members:
+
+QwtSeriesPyramid
+~~~~~~~~~~~~~~~~
+
+.. autoclass:: QwtSeriesPyramid
+   :members:
+
 QwtPointArrayData
 ~~~~~~~~~~~~~~~~~
 
 .. autoclass:: QwtPointArrayData
    :members:
 
+QwtCircularBufferData
+~~~~~~~~~~~~~~~~~~~~~
+
+.. autoclass:: QwtCircularBufferData
+   :members:
+
+QwtGrowableData
+~~~~~~~~~~~~~~~
+
+.. autoclass:: QwtGrowableData
+   :members:
+
+QwtMemMapData
+~~~~~~~~~~~~~
+
+.. autoclass:: QwtMemMapData
+   :members:
+
 QwtSeriesStore
 ~~~~~~~~~~~~~~
 
@@ -34,10 +64,13 @@ QwtSeriesStore
    :members:
 """
 
+import os
+import tempfile
 import numpy as np
 
 from .plot import QwtPlotItem, QwtPlotItem_PrivateData
 from .text import QwtText
+from .py3compat import is_text_string
 
 from .qt.QtCore import Qt, QRectF, QPointF
 
@@ -88,13 +121,43 @@ class QwtPlotSeriesItem(QwtPlotItem):
     def draw(self, painter, xMap, yMap, canvasRect):
         """
         Draw the complete series
+        
+        Only the range of samples returned by :py:meth:`visibleRange()` 
+        is drawn.
 
         :param QPainter painter: Painter
         :param .scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
         :param .scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
         :param QRectF canvasRect: Contents rectangle of the canvas
         """
-        self.drawSeries(painter, xMap, yMap, canvasRect, 0, -1)
+        from_, to = self.visibleRange(xMap, yMap, canvasRect)
+        self.drawSeries(painter, xMap, yMap, canvasRect, from_, to)
+    
+    def visibleRange(self, xMap, yMap, canvasRect, margin=0.):
+        """
+        Return the range of samples which may be visible on the canvas
+        
+        The part of the scales which is visible in `canvasRect` is set as
+        "rectangle of interest" of the series, which returns the range 
+        of samples intersecting it (see 
+        :py:meth:`.plot_series.QwtSeriesData.rangeOfInterest()`).
+        
+        :param .scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+        :param .scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+        :param QRectF canvasRect: Contents rectangle of the canvas
+        :param float margin: Margin around `canvasRect`, in pixels
+        :return: Tuple (from_, to) of sample indexes, to < 0 meaning the last sample
+        """
+        series = self.data()
+        if series is None:
+            return 0, -1
+        x1 = xMap.invTransform(canvasRect.left()-margin)
+        x2 = xMap.invTransform(canvasRect.right()+margin)
+        y1 = yMap.invTransform(canvasRect.top()-margin)
+        y2 = yMap.invTransform(canvasRect.bottom()+margin)
+        rect = QRectF(min([x1, x2]), min([y1, y2]), abs(x2-x1), abs(y2-y1))
+        self.setRectOfInterest(rect)
+        return series.rangeOfInterest()
     
     def boundingRect(self):
         return self.dataRect()
@@ -154,6 +217,46 @@ class QwtSeriesData(object):
         """
         pass
     
+    def rangeOfInterest(self):
+        """
+        Return the range of samples intersecting the "rect of interest"
+        
+        Samples before the first one and after the last one of the range
+        have to be outside the rectangle of interest, and their neighbours
+        as well: lines drawn between them can't cross the rectangle.
+        
+        The default implementation returns the range of all samples.
+        
+        :return: Tuple (from_, to) of sample indexes, to < 0 meaning the last sample
+        
+        .. seealso::
+        
+            :py:meth:`setRectOfInterest()`
+        """
+        return 0, -1
+    
+    def levelOfDetail(self):
+        """
+        Return the level of detail pyramid of the series, used for drawing
+        huge series (see :py:class:`QwtSeriesPyramid`)
+        
+        The default implementation returns None (no pyramid).
+        
+        :return: `QwtSeriesPyramid` object or None
+        """
+        return None
+    
+    def invalidate(self):
+        """
+        Discard the information cached about the samples (e.g. the 
+        bounding rectangle), after the samples have been modified in place
+        
+        .. seealso::
+        
+            :py:meth:`.plot_curve.QwtPlotCurve.dataChanged()`
+        """
+        self._boundingRect = QRectF(0.0, 0.0, -1.0, -1.0)
+    
     def size(self):
         """
         :return: Number of samples
@@ -181,20 +284,413 @@ class QwtSeriesData(object):
         pass
 
 
+def qwtFiniteBounds(values):
+    """
+    Return the extrema of the finite values of an array
+    """
+    vmin, vmax = np.fmin.reduce(values), np.fmax.reduce(values)
+    if not (np.isfinite(vmin) and np.isfinite(vmax)):
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return np.nan, np.nan
+        vmin, vmax = values.min(), values.max()
+    return vmin, vmax
+
+
+def qwtRangeOfInterest(xData, rect):
+    """
+    Return the range of samples intersecting a rectangle, with one sample
+    of margin on each side, for a series of increasing x values
+    """
+    size = xData.size
+    i0 = np.searchsorted(xData, rect.left(), side='left')
+    i1 = np.searchsorted(xData, rect.right(), side='right')
+    return int(max([0, i0-1])), int(min([i1, size-1]))
+
+
+def qwtRangeRect(xBounds, yBounds):
+    """
+    Return the rectangle of x and y bounds (invalid, when not defined)
+    """
+    (xmin, xmax), (ymin, ymax) = xBounds, yBounds
+    if np.isnan(xmin) or np.isnan(ymin):
+        return QRectF(0.0, 0.0, -1.0, -1.0)
+    return QRectF(xmin, ymin, xmax-xmin, ymax-ymin)
+
+
+class QwtMinMaxIndex(object):
+    """
+    Index of the extrema of an array, for fast range bounds
+    
+    The array is split into blocks, whose minimum and maximum values are
+    stored; the resulting arrays of extrema are split again into blocks,
+    and so on. The extrema of any index range are then computed from 
+    a few blocks at each level, i.e. in O(log(n)) time.
+    
+    The index does not keep a reference to the array: the array has to be
+    passed to the methods of the index (it may be reallocated between 
+    calls, as long as its values are unchanged).
+    
+    Not a number values are ignored.
+    
+    .. py:class:: QwtMinMaxIndex([values=None], [blockSize=256])
+    
+        :param numpy.array values: Array to be indexed
+        :param int blockSize: Number of values per block
+    """
+    def __init__(self, values=None, blockSize=256):
+        self.__blockSize = max([2, blockSize])
+        self.__size = 0
+        self.__levels = []
+        if values is not None:
+            self.update(values)
+    
+    def size(self):
+        """
+        :return: Number of indexed values
+        """
+        return self.__size
+    
+    def update(self, values, start=0):
+        """
+        Update the index, when the values of the array have changed 
+        from position `start` (e.g. when values have been appended)
+        
+        Only blocks including changed values are computed again.
+        
+        :param numpy.array values: Indexed array
+        :param int start: Index of the first changed value
+        """
+        blockSize = self.__blockSize
+        size = values.size
+        start = max([0, min([start, self.__size, size])])
+        self.__size = size
+        mins = maxs = values
+        level = 0
+        while size > 1:
+            block = start//blockSize if level < len(self.__levels) else 0
+            count = (size+blockSize-1)//blockSize
+            offsets = np.arange(block*blockSize, size, blockSize)
+            blockMins = np.fmin.reduceat(mins[:size], offsets)
+            blockMaxs = np.fmax.reduceat(maxs[:size], offsets)
+            if level == len(self.__levels):
+                self.__levels.append((blockMins, blockMaxs, count))
+            else:
+                levelMins, levelMaxs, _count = self.__levels[level]
+                if levelMins.size < count:
+                    # Capacity is doubled to keep appends incremental
+                    capacity = max([count, 2*levelMins.size])
+                    newMins = np.empty(capacity, blockMins.dtype)
+                    newMaxs = np.empty(capacity, blockMaxs.dtype)
+                    newMins[:block] = levelMins[:block]
+                    newMaxs[:block] = levelMaxs[:block]
+                    levelMins, levelMaxs = newMins, newMaxs
+                levelMins[block:count] = blockMins
+                levelMaxs[block:count] = blockMaxs
+                self.__levels[level] = (levelMins, levelMaxs, count)
+            mins, maxs = self.__levels[level][:2]
+            start, size = block, count
+            level += 1
+        del self.__levels[level:]
+    
+    def bounds(self, values, from_=0, to=None):
+        """
+        Return the extrema of a range of values
+        
+        :param numpy.array values: Indexed array
+        :param int from_: Index of the first value of the range
+        :param int to: Index of the last value of the range (default: last value)
+        :return: Tuple (minimum, maximum), or (nan, nan) for an empty range
+        """
+        if to is None:
+            to = self.__size-1
+        i0, i1 = max([0, from_]), min([to+1, self.__size])
+        blockSize = self.__blockSize
+        vmin = vmax = np.nan
+        mins = maxs = values
+        for levelMins, levelMaxs, _count in self.__levels:
+            if i1-i0 <= 2*blockSize:
+                break
+            b0 = (i0+blockSize-1)//blockSize
+            b1 = i1//blockSize
+            for j0, j1 in ((i0, b0*blockSize), (b1*blockSize, i1)):
+                if j1 > j0:
+                    vmin = np.fmin(vmin, np.fmin.reduce(mins[j0:j1]))
+                    vmax = np.fmax(vmax, np.fmax.reduce(maxs[j0:j1]))
+            mins, maxs, i0, i1 = levelMins, levelMaxs, b0, b1
+        if i1 > i0:
+            vmin = np.fmin(vmin, np.fmin.reduce(mins[i0:i1]))
+            vmax = np.fmax(vmax, np.fmax.reduce(maxs[i0:i1]))
+        return vmin, vmax
+
+
+def qwtBlockExtrema(values):
+    """
+    Return the extrema of the rows of a 2-D array of values, and whether
+    the minimum comes before the maximum in each row
+    """
+    nans = np.isnan(values)
+    imin = np.argmin(np.where(nans, np.inf, values), axis=1)
+    imax = np.argmax(np.where(nans, -np.inf, values), axis=1)
+    return (np.fmin.reduce(values, axis=1), np.fmax.reduce(values, axis=1),
+            imin <= imax)
+
+
+def qwtPairExtrema(mins, maxs, minFirst):
+    """
+    Return the extrema of pairs of consecutive blocks, and whether the 
+    minimum comes before the maximum in each pair
+    """
+    lMins, rMins = mins[0::2], mins[1::2]
+    lMaxs, rMaxs = maxs[0::2], maxs[1::2]
+    with np.errstate(invalid='ignore'):
+        minLeft = (lMins <= rMins) | np.isnan(rMins)
+        maxLeft = (lMaxs >= rMaxs) | np.isnan(rMaxs)
+    # Order of the extrema: from the child block including both
+    # of them, otherwise from the child blocks including them
+    order = np.where(minLeft, minFirst[0::2], minFirst[1::2])
+    return (np.fmin(lMins, rMins), np.fmax(lMaxs, rMaxs),
+            np.where(minLeft == maxLeft, order, minLeft))
+
+
+class QwtSeriesPyramid(object):
+    """
+    Level of detail pyramid of a series with increasing x values
+    
+    The samples are split into blocks of `blockSize` samples, whose 
+    minimum and maximum y values are stored (and which of them comes 
+    first): these blocks are the first level of the pyramid. Blocks of 
+    each level are then paired into the blocks of the following level.
+    
+    A range of samples may then be reduced to 4 points per block (first,
+    minimum, maximum and last) at any level: see :py:meth:`decimate()`.
+    The pyramid takes about 2 bytes per sample, for the default block size.
+    
+    The pyramid does not keep a reference to the arrays: they have to be 
+    passed to the methods of the pyramid.
+    
+    When a file is given, the levels are stored into this file, which is 
+    memory-mapped: the pyramid of a series larger than memory is built 
+    by chunks, and only the blocks which are actually used are read from 
+    the disk. An existing file of the expected size is reused as is. The 
+    levels of a pyramid stored in a file can't be updated.
+    
+    .. py:class:: QwtSeriesPyramid([yData=None], [blockSize=16], [path=None])
+    
+        :param numpy.array yData: Array of y values
+        :param int blockSize: Number of samples per block of the first level
+        :param path: File storing the levels (if None, levels are stored in memory)
+        :type path: str or file object or None
+    """
+    # Levels stored in a file: one record per block
+    RECORD = np.dtype([('mins', np.float64), ('maxs', np.float64),
+                       ('minFirst', np.bool_)])
+    
+    def __init__(self, yData=None, blockSize=16, path=None):
+        self.__blockSize = max([2, blockSize])
+        self.__size = 0
+        self.__levels = []
+        if path is not None:
+            self.__map(yData, path)
+        elif yData is not None:
+            self.update(yData)
+    
+    def size(self):
+        """
+        :return: Number of indexed samples
+        """
+        return self.__size
+    
+    def __store(self, level, block, count, mins, maxs, minFirst):
+        """Store blocks, starting at index `block`, into a level"""
+        if level == len(self.__levels):
+            self.__levels.append([np.empty(0), np.empty(0),
+                                  np.empty(0, dtype=bool), 0])
+        levelData = self.__levels[level]
+        if levelData[0].size < count:
+            # Capacity is doubled to keep appends incremental
+            capacity = max([count, 2*levelData[0].size])
+            for index in range(3):
+                array = np.empty(capacity, levelData[index].dtype)
+                array[:block] = levelData[index][:block]
+                levelData[index] = array
+        end = block+mins.size
+        levelData[0][block:end] = mins
+        levelData[1][block:end] = maxs
+        levelData[2][block:end] = minFirst
+        levelData[3] = count
+    
+    def __map(self, yData, path):
+        """Map the levels stored in a file, building them if necessary"""
+        blockSize = self.__blockSize
+        size = yData.size
+        counts = []
+        count = size//blockSize
+        if count:
+            counts.append(count)
+        while count >= 2:
+            count = count//2
+            counts.append(count)
+        self.__size = size
+        if not counts:
+            return
+        total = sum(counts)
+        if is_text_string(path) and os.path.isfile(path) and\
+           os.path.getsize(path) == total*self.RECORD.itemsize:
+            self.__mapLevels(np.memmap(path, self.RECORD, mode='r',
+                                       shape=(total,)), counts)
+            return
+        if is_text_string(path):
+            # Levels are built into a temporary file, renamed when complete
+            buildPath = path+'.tmp'
+        else:
+            buildPath = path
+        records = np.memmap(buildPath, self.RECORD, mode='w+',
+                            shape=(total,))
+        self.__mapLevels(records, counts)
+        self.__buildLevels(yData)
+        records.flush()
+        if buildPath is not path:
+            del records
+            self.__levels = []
+            if os.path.isfile(path):
+                os.remove(path)
+            os.rename(buildPath, path)
+            self.__mapLevels(np.memmap(path, self.RECORD, mode='r',
+                                       shape=(total,)), counts)
+    
+    def __buildLevels(self, yData):
+        """Compute the blocks of all levels (levels are preallocated)"""
+        blockSize = self.__blockSize
+        # Levels are built by chunks, to bound the size of temporary arrays
+        chunk = max([1, 2**20//blockSize])
+        mins, maxs, minFirst, count = self.__levels[0]
+        for index in range(0, count, chunk):
+            end = min([index+chunk, count])
+            values = np.asarray(yData[index*blockSize:end*blockSize],
+                                dtype=np.float64).reshape(-1, blockSize)
+            mins[index:end], maxs[index:end], minFirst[index:end] =\
+                qwtBlockExtrema(values)
+        for previous, levelData in zip(self.__levels[:-1], self.__levels[1:]):
+            mins, maxs, minFirst, count = levelData
+            for index in range(0, count, chunk):
+                end = min([index+chunk, count])
+                sl = slice(2*index, 2*end)
+                mins[index:end], maxs[index:end], minFirst[index:end] =\
+                    qwtPairExtrema(previous[0][sl], previous[1][sl],
+                                   previous[2][sl])
+    
+    def __mapLevels(self, records, counts):
+        """Set the levels from the records of a memory-mapped file"""
+        offset = 0
+        self.__levels = []
+        for count in counts:
+            levelRecords = records[offset:offset+count]
+            self.__levels.append([levelRecords['mins'],
+                                  levelRecords['maxs'],
+                                  levelRecords['minFirst'], count])
+            offset += count
+    
+    def update(self, yData, start=0):
+        """
+        Update the pyramid, when the values of the array have changed 
+        from position `start` (e.g. when samples have been appended)
+        
+        Only blocks including changed values are computed again.
+        
+        :param numpy.array yData: Array of y values
+        :param int start: Index of the first changed value
+        """
+        blockSize = self.__blockSize
+        size = yData.size
+        start = max([0, min([start, self.__size, size])])
+        self.__size = size
+        block = start//blockSize
+        count = size//blockSize
+        # First level: blocks of samples, processed by chunks to bound
+        # the size of temporary arrays
+        chunk = max([1, 2**20//blockSize])
+        for index in range(block, count, chunk):
+            end = min([index+chunk, count])
+            values = np.asarray(yData[index*blockSize:end*blockSize],
+                                dtype=np.float64).reshape(-1, blockSize)
+            self.__store(0, index, count, *qwtBlockExtrema(values))
+        if count == 0:
+            del self.__levels[:]
+            return
+        self.__levels[0][3] = count
+        # Following levels: pairs of blocks of the previous level
+        level = 1
+        while count >= 2:
+            mins, maxs, minFirst, _count = self.__levels[level-1]
+            block = block//2 if level < len(self.__levels) else 0
+            count = count//2
+            sl = slice(2*block, 2*count)
+            self.__store(level, block, count,
+                         *qwtPairExtrema(mins[sl], maxs[sl], minFirst[sl]))
+            level += 1
+        del self.__levels[level:]
+    
+    def decimate(self, xData, yData, from_, to, buckets):
+        """
+        Reduce a range of samples to 4 points (first, minimum, maximum, 
+        last) per block, at the coarsest level of the pyramid giving at 
+        least `buckets` blocks for the range
+        
+        Samples of the range before the first complete block and after 
+        the last one are returned unchanged.
+        
+        :param numpy.array xData: Array of x values
+        :param numpy.array yData: Array of y values
+        :param int from_: Index of the first sample of the range
+        :param int to: Index of the last sample of the range
+        :param int buckets: Minimum number of blocks
+        :return: Tuple of arrays (x values, y values)
+        """
+        size = to-from_+1
+        level = -1
+        while level+1 < len(self.__levels) and\
+              size//(self.__blockSize << (level+1)) >= buckets:
+            level += 1
+        if level < 0:
+            return xData[from_:to+1], yData[from_:to+1]
+        blockSize = self.__blockSize << level
+        mins, maxs, minFirst, count = self.__levels[level]
+        b0 = (from_+blockSize-1)//blockSize
+        b1 = min([(to+1)//blockSize, count])
+        if b1 <= b0:
+            return xData[from_:to+1], yData[from_:to+1]
+        first = slice(b0*blockSize, b1*blockSize, blockSize)
+        last = slice(b0*blockSize+blockSize-1, b1*blockSize, blockSize)
+        order = minFirst[b0:b1]
+        xs = np.empty(4*(b1-b0))
+        ys = np.empty(4*(b1-b0))
+        xs[0::4] = xs[1::4] = xData[first]
+        xs[2::4] = xs[3::4] = xData[last]
+        ys[0::4] = yData[first]
+        ys[1::4] = np.where(order, mins[b0:b1], maxs[b0:b1])
+        ys[2::4] = np.where(order, maxs[b0:b1], mins[b0:b1])
+        ys[3::4] = yData[last]
+        head, tail = slice(from_, b0*blockSize), slice(b1*blockSize, to+1)
+        return (np.concatenate((xData[head], xs, xData[tail])),
+                np.concatenate((yData[head], ys, yData[tail])))
+
+
 class QwtPointArrayData(QwtSeriesData):
     """
     Interface for iterating over two array objects
     
-    .. py:class:: QwtPointArrayData(x, y, [size=None], [finite=True])
+    .. py:class:: QwtPointArrayData(x, y, [size=None], [finite=True], [copy=True])
     
         :param x: Array of x values
         :type x: list or tuple or numpy.array
         :param y: Array of y values
         :type y: list or tuple or numpy.array
         :param int size: Size of the x and y arrays
-        :param bool finite: if True, keep only finite array elements (remove all infinity and not a number values), otherwise do not filter array elements
+        :param bool finite: if True, keep only finite array elements (remove all infinity and not a number values), otherwise do not filter (nor copy) array elements: curves are then drawn with gaps at non-finite values
+        :param bool copy: if False, arrays without non-finite elements are not copied either (nor converted): changes made to them in place are then drawn after calling `dataChanged()` on the curve
     """
-    def __init__(self, x=None, y=None, size=None, finite=None):
+    def __init__(self, x=None, y=None, size=None, finite=True, copy=True):
         QwtSeriesData.__init__(self)
         if x is None and y is not None:
             x = np.arange(len(y))
@@ -211,28 +707,122 @@ class QwtPointArrayData(QwtSeriesData):
         if size is not None:
             x = np.resize(x, (size, ))
             y = np.resize(y, (size, ))
-        if finite if finite is not None else True:
+        if finite:
             indexes = np.logical_and(np.isfinite(x), np.isfinite(y))
-            self.__x = x[indexes]
-            self.__y = y[indexes]
+            if not copy and indexes.all():
+                self.__x = x
+                self.__y = y
+            else:
+                self.__x = x[indexes]
+                self.__y = y[indexes]
         else:
             self.__x = x
             self.__y = y
+        self.__xIndex = None
+        self.__yIndex = None
+        self.__rectOfInterest = None
+        self.__increasing = None
+        self.__pyramid = None
+    
+    def __isIncreasing(self):
+        """Return True if x values are increasing (checked once)"""
+        if self.__increasing is None:
+            x = self.__x[:self.size()]
+            self.__increasing = bool(np.all(x[1:] >= x[:-1]))
+        return self.__increasing
+    
+    def levelOfDetail(self):
+        """
+        Return the level of detail pyramid of the series, built at the
+        first call, when x values are increasing
+        
+        :return: `QwtSeriesPyramid` object or None
+        """
+        if self.__pyramid is None and self.__isIncreasing():
+            self.__pyramid = QwtSeriesPyramid(self.__y[:self.size()])
+        return self.__pyramid
+    
+    def invalidate(self):
+        """
+        Discard the bounding rectangle, the indexes of extrema, the level 
+        of detail pyramid and the increasing x values flag, after the 
+        arrays have been modified in place
+        
+        .. seealso::
+        
+            :py:meth:`.plot_curve.QwtPlotCurve.dataChanged()`
+        """
+        QwtSeriesData.invalidate(self)
+        self.__xIndex = None
+        self.__yIndex = None
+        self.__increasing = None
+        self.__pyramid = None
+    
+    def setRectOfInterest(self, rect):
+        """
+        Set the "rect of interest"
+        
+        :param QRectF rect: Rectangle of interest
+        
+        .. seealso::
+        
+            :py:meth:`rangeOfInterest()`
+        """
+        self.__rectOfInterest = QRectF(rect)
+    
+    def rangeOfInterest(self):
+        """
+        Return the range of samples intersecting the "rect of interest"
+        
+        When x values are increasing (this is checked once, at the first 
+        call), the range is found by binary search. Otherwise, the range 
+        of all samples is returned.
+        
+        :return: Tuple (from_, to) of sample indexes, to < 0 meaning the last sample
+        
+        .. seealso::
+        
+            :py:meth:`setRectOfInterest()`
+        """
+        if self.__rectOfInterest is None or self.size() < 2 or\
+           not self.__isIncreasing():
+            return 0, -1
+        return qwtRangeOfInterest(self.__x[:self.size()],
+                                  self.__rectOfInterest)
         
     def boundingRect(self):
         """
         Calculate the bounding rectangle
 
         The bounding rectangle is calculated once by iterating over all
-        points and is stored for all following requests.
+        points and is stored for all following requests. Non-finite values
+        are ignored.
 
         :return: Bounding rectangle
         """
-        xmin = self.__x.min()
-        xmax = self.__x.max()
-        ymin = self.__y.min()
-        ymax = self.__y.max()
-        return QRectF(xmin, ymin, xmax-xmin, ymax-ymin)
+        if self._boundingRect.width() < 0:
+            xmin, xmax = qwtFiniteBounds(self.__x)
+            ymin, ymax = qwtFiniteBounds(self.__y)
+            self._boundingRect = QRectF(xmin, ymin, xmax-xmin, ymax-ymin)
+        return QRectF(self._boundingRect)
+    
+    def rangeBoundingRect(self, from_, to):
+        """
+        Calculate the bounding rectangle of a range of points
+        
+        An index of the extrema of the arrays is built at the first call
+        (see :py:class:`QwtMinMaxIndex`): the following ones take 
+        O(log(n)) time.
+        
+        :param int from_: Index of the first point of the range
+        :param int to: Index of the last point of the range
+        :return: Bounding rectangle, or an invalid rectangle for an empty range
+        """
+        if self.__xIndex is None:
+            self.__xIndex = QwtMinMaxIndex(self.__x)
+            self.__yIndex = QwtMinMaxIndex(self.__y)
+        return qwtRangeRect(self.__xIndex.bounds(self.__x, from_, to),
+                            self.__yIndex.bounds(self.__y, from_, to))
     
     def size(self):
         """
@@ -260,6 +850,675 @@ class QwtPointArrayData(QwtSeriesData):
         return self.__y
 
 
+class QwtCircularBufferData(QwtSeriesData):
+    """
+    Fixed capacity series of points, for streaming data
+    
+    Samples are appended at the end of the series: once the capacity is
+    reached, each new sample replaces the oldest one. Appending a sample
+    does not reallocate nor copy the series, and the bounding rectangle
+    is maintained incrementally.
+    
+    Each sample is stored twice in arrays of twice the capacity, so that
+    the samples of the series are always contiguous: `xData()` and 
+    `yData()` return views on the arrays, in the order of the samples.
+    
+    Unlike `QwtPointArrayData`, non-finite values are not removed 
+    from the series (they are ignored by `boundingRect()` though).
+    
+    .. py:class:: QwtCircularBufferData(capacity, [dtype=numpy.float64])
+    
+        :param int capacity: Maximum number of samples
+        :param dtype: Data type of x and y values
+    
+    Example::
+    
+        data = QwtCircularBufferData(10000)
+        curve.setData(data)
+        ...
+        data.extend(xs, ys)
+        curve.dataChanged()
+        plot.replot()
+    
+    .. note::
+    
+        The curve has to be notified of the new samples by calling 
+        :py:meth:`.plot_curve.QwtPlotCurve.dataChanged()`
+    """
+    def __init__(self, capacity, dtype=np.float64):
+        QwtSeriesData.__init__(self)
+        if capacity < 1:
+            raise ValueError("capacity must be strictly positive")
+        self.__capacity = capacity
+        self.__x = np.zeros(2*capacity, dtype)
+        self.__y = np.zeros(2*capacity, dtype)
+        self.__start = 0
+        self.__size = 0
+        self.__bounds = None
+    
+    def capacity(self):
+        """
+        :return: Maximum number of samples
+        """
+        return self.__capacity
+    
+    def clear(self):
+        """
+        Remove all samples
+        """
+        self.__start = 0
+        self.__size = 0
+        self.__bounds = None
+        
+    def append(self, x, y):
+        """
+        Append a sample, replacing the oldest one when the capacity
+        is reached
+        
+        :param float x: x value
+        :param float y: y value
+        
+        .. seealso::
+        
+            :py:meth:`extend()`
+        """
+        capacity = self.__capacity
+        index = self.__start+self.__size
+        if index >= capacity:
+            index -= capacity
+        if self.__size == capacity:
+            self.__dropBounds(self.__x[index:index+1],
+                              self.__y[index:index+1])
+            self.__start = index+1 if index+1 < capacity else 0
+        else:
+            self.__size += 1
+        self.__x[index] = self.__x[index+capacity] = x
+        self.__y[index] = self.__y[index+capacity] = y
+        self.__addBounds(self.__x[index:index+1], self.__y[index:index+1])
+    
+    def extend(self, xs, ys):
+        """
+        Append samples, replacing the oldest ones when the capacity
+        is reached
+        
+        :param numpy.array xs: Array of x values
+        :param numpy.array ys: Array of y values
+        
+        .. seealso::
+        
+            :py:meth:`append()`
+        """
+        capacity = self.__capacity
+        size = min([len(xs), len(ys)])
+        xs = np.asarray(xs)[max([0, size-capacity]):size]
+        ys = np.asarray(ys)[max([0, size-capacity]):size]
+        size = xs.size
+        if size == 0:
+            return
+        dropped = max([0, self.__size+size-capacity])
+        if dropped:
+            start = self.__start
+            self.__dropBounds(self.__x[start:start+dropped],
+                              self.__y[start:start+dropped])
+        indexes = (self.__start+self.__size+np.arange(size)) % capacity
+        for data, values in ((self.__x, xs), (self.__y, ys)):
+            data[indexes] = data[indexes+capacity] = values
+        self.__start = (self.__start+dropped) % capacity
+        self.__size = min([self.__size+size, capacity])
+        self.__addBounds(xs, ys)
+    
+    def __addBounds(self, xs, ys):
+        """Extend the bounding rectangle to new values"""
+        if self.__bounds is None:
+            if self.__size > xs.size:
+                return
+            self.__bounds = (np.nan, np.nan, np.nan, np.nan)
+        xmin, xmax, ymin, ymax = self.__bounds
+        (xsMin, xsMax), (ysMin, ysMax) = qwtFiniteBounds(xs),\
+                                         qwtFiniteBounds(ys)
+        self.__bounds = (np.fmin(xmin, xsMin), np.fmax(xmax, xsMax),
+                         np.fmin(ymin, ysMin), np.fmax(ymax, ysMax))
+    
+    def __dropBounds(self, xs, ys):
+        """Invalidate the bounding rectangle when dropping extremum values"""
+        if self.__bounds is not None:
+            xmin, xmax, ymin, ymax = self.__bounds
+            if np.fmin.reduce(xs) <= xmin or np.fmax.reduce(xs) >= xmax or\
+               np.fmin.reduce(ys) <= ymin or np.fmax.reduce(ys) >= ymax:
+                self.__bounds = None
+    
+    def boundingRect(self):
+        """
+        Calculate the bounding rectangle
+
+        The bounding rectangle is updated when appending samples, and is
+        only calculated again by iterating over all samples when extremum 
+        values have been replaced.
+
+        :return: Bounding rectangle
+        """
+        if self.__size == 0:
+            return QRectF(0.0, 0.0, -1.0, -1.0)
+        if self.__bounds is None:
+            self.__bounds = (np.nan, np.nan, np.nan, np.nan)
+            self.__addBounds(self.xData(), self.yData())
+        xmin, xmax, ymin, ymax = self.__bounds
+        return QRectF(xmin, ymin, xmax-xmin, ymax-ymin)
+    
+    def size(self):
+        """
+        :return: Number of samples
+        """
+        return self.__size
+    
+    def sample(self, index):
+        """
+        :param int index: Index
+        :return: Sample at position `index`
+        """
+        index += self.__start
+        return QPointF(self.__x[index], self.__y[index])
+    
+    def xData(self):
+        """
+        :return: Array of the x-values (view on the samples, from the oldest to the newest one)
+        """
+        return self.__x[self.__start:self.__start+self.__size]
+        
+    def yData(self):
+        """
+        :return: Array of the y-values (view on the samples, from the oldest to the newest one)
+        """
+        return self.__y[self.__start:self.__start+self.__size]
+
+
+class QwtGrowableData(QwtSeriesData):
+    """
+    Append-only series of points, for data acquisition
+    
+    Samples are stored in preallocated arrays, whose capacity is doubled 
+    when full: appending samples costs (amortized) time proportional to 
+    the number of new samples only, whatever the size of the series.
+    The bounding rectangle is updated when appending samples.
+    
+    `xData()` and `yData()` return views on the valid part of the arrays.
+    
+    .. py:class:: QwtGrowableData([capacity=1024], [dtype=numpy.float64], [finite=True])
+    
+        :param int capacity: Initial capacity
+        :param dtype: Data type of x and y values
+        :param bool finite: if True, keep only finite samples (appended samples with an infinity or not a number value are ignored)
+    
+    Example::
+    
+        data = QwtGrowableData()
+        curve.setData(data)
+        ...
+        data.extend(xs, ys)
+        curve.dataChanged()
+        plot.replot()
+    
+    .. note::
+    
+        The curve has to be notified of the new samples by calling 
+        :py:meth:`.plot_curve.QwtPlotCurve.dataChanged()`
+    """
+    def __init__(self, capacity=1024, dtype=np.float64, finite=True):
+        QwtSeriesData.__init__(self)
+        capacity = max([1, capacity])
+        self.__x = np.zeros(capacity, dtype)
+        self.__y = np.zeros(capacity, dtype)
+        self.__size = 0
+        self.__finite = finite
+        self.__bounds = None
+        self.__xIndex = None
+        self.__yIndex = None
+        self.__rectOfInterest = None
+        self.__increasing = True
+        self.__pyramid = None
+    
+    def capacity(self):
+        """
+        :return: Number of samples which may be stored without reallocation
+        """
+        return self.__x.size
+    
+    def reserve(self, capacity):
+        """
+        Reallocate the arrays, if necessary, to store at least `capacity`
+        samples
+        
+        :param int capacity: Capacity
+        """
+        if capacity > self.__x.size:
+            size = self.__size
+            x = np.zeros(capacity, self.__x.dtype)
+            y = np.zeros(capacity, self.__y.dtype)
+            x[:size], y[:size] = self.__x[:size], self.__y[:size]
+            self.__x, self.__y = x, y
+    
+    def clear(self):
+        """
+        Remove all samples (the capacity is unchanged)
+        """
+        self.__size = 0
+        self.__bounds = None
+        self.__xIndex = None
+        self.__yIndex = None
+        self.__increasing = True
+        self.__pyramid = None
+        
+    def append(self, x, y):
+        """
+        Append a sample
+        
+        :param float x: x value
+        :param float y: y value
+        
+        .. seealso::
+        
+            :py:meth:`extend()`
+        """
+        if self.__finite and not (np.isfinite(x) and np.isfinite(y)):
+            return
+        size = self.__size
+        if size and not self.__x[size-1] <= x:
+            self.__increasing = False
+        if size == self.__x.size:
+            self.reserve(2*size)
+        self.__x[size] = x
+        self.__y[size] = y
+        self.__size = size+1
+        xmin, xmax, ymin, ymax = self.__bounds or (np.nan,)*4
+        if np.isfinite(x):
+            xmin, xmax = np.fmin(xmin, x), np.fmax(xmax, x)
+        if np.isfinite(y):
+            ymin, ymax = np.fmin(ymin, y), np.fmax(ymax, y)
+        self.__bounds = (xmin, xmax, ymin, ymax)
+    
+    def extend(self, xs, ys):
+        """
+        Append samples
+        
+        :param numpy.array xs: Array of x values
+        :param numpy.array ys: Array of y values
+        
+        .. seealso::
+        
+            :py:meth:`append()`
+        """
+        size = min([len(xs), len(ys)])
+        xs, ys = np.asarray(xs)[:size], np.asarray(ys)[:size]
+        if self.__finite:
+            indexes = np.logical_and(np.isfinite(xs), np.isfinite(ys))
+            if not indexes.all():
+                xs, ys = xs[indexes], ys[indexes]
+                size = xs.size
+        if size == 0:
+            return
+        start = self.__size
+        if self.__increasing:
+            self.__increasing = bool(np.all(xs[1:] >= xs[:-1])) and\
+                                not (start and self.__x[start-1] > xs[0])
+        if start+size > self.__x.size:
+            self.reserve(max([2*self.__x.size, start+size]))
+        self.__x[start:start+size] = xs
+        self.__y[start:start+size] = ys
+        self.__size = start+size
+        bounds = qwtFiniteBounds(xs)+qwtFiniteBounds(ys)
+        if self.__bounds is not None:
+            xmin, xmax, ymin, ymax = self.__bounds
+            bounds = (np.fmin(xmin, bounds[0]), np.fmax(xmax, bounds[1]),
+                      np.fmin(ymin, bounds[2]), np.fmax(ymax, bounds[3]))
+        self.__bounds = bounds
+    
+    def boundingRect(self):
+        """
+        Return the bounding rectangle
+
+        The bounding rectangle is updated when appending samples.
+
+        :return: Bounding rectangle
+        """
+        if self.__bounds is None:
+            return QRectF(0.0, 0.0, -1.0, -1.0)
+        xmin, xmax, ymin, ymax = self.__bounds
+        return QRectF(xmin, ymin, xmax-xmin, ymax-ymin)
+    
+    def rangeBoundingRect(self, from_, to):
+        """
+        Calculate the bounding rectangle of a range of samples
+        
+        An index of the extrema of the arrays is built at the first call
+        (see :py:class:`QwtMinMaxIndex`), and updated with the samples 
+        appended since the previous call: the following calls take 
+        O(log(n)) time.
+        
+        :param int from_: Index of the first sample of the range
+        :param int to: Index of the last sample of the range
+        :return: Bounding rectangle, or an invalid rectangle for an empty range
+        """
+        xs, ys = self.xData(), self.yData()
+        if self.__xIndex is None:
+            self.__xIndex = QwtMinMaxIndex(xs)
+            self.__yIndex = QwtMinMaxIndex(ys)
+        elif self.__xIndex.size() != self.__size:
+            self.__xIndex.update(xs, self.__xIndex.size())
+            self.__yIndex.update(ys, self.__yIndex.size())
+        return qwtRangeRect(self.__xIndex.bounds(xs, from_, to),
+                            self.__yIndex.bounds(ys, from_, to))
+    
+    def setRectOfInterest(self, rect):
+        """
+        Set the "rect of interest"
+        
+        :param QRectF rect: Rectangle of interest
+        
+        .. seealso::
+        
+            :py:meth:`rangeOfInterest()`
+        """
+        self.__rectOfInterest = QRectF(rect)
+    
+    def rangeOfInterest(self):
+        """
+        Return the range of samples intersecting the "rect of interest"
+        
+        When x values are increasing (this is checked when appending 
+        samples), the range is found by binary search. Otherwise, the 
+        range of all samples is returned.
+        
+        :return: Tuple (from_, to) of sample indexes, to < 0 meaning the last sample
+        
+        .. seealso::
+        
+            :py:meth:`setRectOfInterest()`
+        """
+        if self.__rectOfInterest is None or not self.__increasing or\
+           self.__size < 2:
+            return 0, -1
+        return qwtRangeOfInterest(self.xData(), self.__rectOfInterest)
+    
+    def levelOfDetail(self):
+        """
+        Return the level of detail pyramid of the series, when x values 
+        are increasing
+        
+        The pyramid is built at the first call, and updated with the 
+        samples appended since the previous call.
+        
+        :return: `QwtSeriesPyramid` object or None
+        """
+        if not self.__increasing:
+            return None
+        if self.__pyramid is None:
+            self.__pyramid = QwtSeriesPyramid(self.yData())
+        elif self.__pyramid.size() != self.__size:
+            self.__pyramid.update(self.yData(), self.__pyramid.size())
+        return self.__pyramid
+    
+    def size(self):
+        """
+        :return: Number of samples
+        """
+        return self.__size
+    
+    def sample(self, index):
+        """
+        :param int index: Index
+        :return: Sample at position `index`
+        """
+        return QPointF(self.__x[index], self.__y[index])
+    
+    def xData(self):
+        """
+        :return: Array of the x-values (view on the valid part of the array)
+        """
+        return self.__x[:self.__size]
+        
+    def yData(self):
+        """
+        :return: Array of the y-values (view on the valid part of the array)
+        """
+        return self.__y[:self.__size]
+
+
+def qwtOpenArray(data, dtype, offset):
+    """
+    Return a read-only memory-mapped array of a raw binary or a `.npy` file
+    (arrays are returned unchanged)
+    """
+    if not is_text_string(data):
+        return data
+    if data.endswith('.npy'):
+        return np.load(data, mmap_mode='r')
+    return np.memmap(data, dtype=dtype, mode='r', offset=offset)
+
+
+class QwtMemMapData(QwtSeriesData):
+    """
+    Series of points stored in files, for datasets larger than memory
+    
+    x and y values are read from raw binary files (e.g. little-endian 
+    float32 or float64 values) or from `.npy` files, which are 
+    memory-mapped: only the parts of the files which are actually used 
+    are read from the disk.
+    
+    When opening the series, the minimum and maximum values of each chunk
+    of samples are computed (iterating once over the files). They are 
+    saved into a sidecar file (`<file>.minmax.npz`) next to each data file,
+    and read again the next time the file is opened, unless the file 
+    has been modified since. The bounding rectangle of the series, or of 
+    any range of samples (see :py:meth:`rangeBoundingRect()`), is then
+    computed from these summaries, reading at most two chunks of data.
+    
+    When x values are increasing, the range of samples intersecting the
+    "rect of interest" is found by binary search in the x file (see
+    :py:meth:`rangeOfInterest()`), and the level of detail pyramid of the
+    series is stored into a memory-mapped sidecar file (`<file>.lod`) 
+    next to the y data file (see :py:meth:`levelOfDetail()`).
+    
+    .. py:class:: QwtMemMapData(x, y, [dtype=numpy.float64], [offset=0], [chunkSize=65536])
+    
+        :param x: File name (or array) of x values
+        :type x: str or numpy.array
+        :param y: File name (or array) of y values
+        :type y: str or numpy.array
+        :param dtype: Data type of raw binary files (e.g. `'<f4'`)
+        :param int offset: Offset of the data in raw binary files, in bytes
+        :param int chunkSize: Number of samples per chunk of the summaries
+    """
+    def __init__(self, x, y, dtype=np.float64, offset=0, chunkSize=65536):
+        QwtSeriesData.__init__(self)
+        self.__chunkSize = chunkSize
+        self.__x = qwtOpenArray(x, dtype, offset)
+        self.__y = qwtOpenArray(y, dtype, offset)
+        self.__size = min([self.__x.size, self.__y.size])
+        self.__x = self.__x[:self.__size]
+        self.__y = self.__y[:self.__size]
+        self.__xSummary = self.__summary(self.__x, x)
+        self.__ySummary = self.__summary(self.__y, y)
+        self.__yPath = y if is_text_string(y) else None
+        mins, maxs, increasing = self.__xSummary
+        self.__increasing = bool(np.all(increasing) and
+                                 np.all(maxs[:-1] <= mins[1:]))
+        self.__rectOfInterest = None
+        self.__pyramid = None
+    
+    def __summary(self, values, path):
+        """
+        Return the minimum and maximum values of each chunk, and whether
+        values are increasing in each chunk, reading them from the sidecar
+        file when it's up to date
+        """
+        chunkSize = self.__chunkSize
+        if is_text_string(path):
+            sidecar = path+'.minmax.npz'
+            mtime = os.path.getmtime(path)
+            try:
+                with np.load(sidecar) as summary:
+                    if int(summary['size']) == values.size and\
+                       int(summary['chunkSize']) == chunkSize and\
+                       float(summary['mtime']) == mtime:
+                        return (summary['mins'], summary['maxs'],
+                                summary['increasing'])
+            except (IOError, OSError, KeyError, ValueError):
+                pass
+        count = (values.size+chunkSize-1)//chunkSize
+        mins, maxs = np.empty(count), np.empty(count)
+        increasing = np.empty(count, dtype=bool)
+        for index in range(count):
+            chunk = np.asarray(values[index*chunkSize:(index+1)*chunkSize])
+            mins[index], maxs[index] = qwtFiniteBounds(chunk)
+            increasing[index] = bool(np.all(chunk[1:] >= chunk[:-1]))
+        if is_text_string(path):
+            try:
+                with open(sidecar, 'wb') as fd:
+                    np.savez(fd, size=values.size, chunkSize=chunkSize,
+                             mtime=mtime, mins=mins, maxs=maxs,
+                             increasing=increasing)
+            except (IOError, OSError):
+                # Read-only directory: summaries will be computed again
+                pass
+        return mins, maxs, increasing
+    
+    def __bounds(self, values, summary, from_, to):
+        """Return the extrema of a range of values, using chunk summaries"""
+        chunkSize = self.__chunkSize
+        i0, i1 = max([0, from_]), min([to+1, self.__size])
+        c0, c1 = (i0+chunkSize-1)//chunkSize, i1//chunkSize
+        if c1 <= c0:
+            return qwtFiniteBounds(np.asarray(values[i0:i1]))
+        mins, maxs, _increasing = summary
+        vmin = np.fmin.reduce(mins[c0:c1])
+        vmax = np.fmax.reduce(maxs[c0:c1])
+        for j0, j1 in ((i0, c0*chunkSize), (c1*chunkSize, i1)):
+            if j1 > j0:
+                bmin, bmax = qwtFiniteBounds(np.asarray(values[j0:j1]))
+                vmin, vmax = np.fmin(vmin, bmin), np.fmax(vmax, bmax)
+        return vmin, vmax
+    
+    def boundingRect(self):
+        """
+        Return the bounding rectangle, computed from the chunk summaries
+        
+        Non-finite values are ignored.
+
+        :return: Bounding rectangle
+        """
+        if self.__size == 0:
+            return QRectF(0.0, 0.0, -1.0, -1.0)
+        if self._boundingRect.width() < 0:
+            self._boundingRect = self.rangeBoundingRect(0, self.__size-1)
+        return QRectF(self._boundingRect)
+    
+    def rangeBoundingRect(self, from_, to):
+        """
+        Calculate the bounding rectangle of a range of samples
+        
+        The rectangle is computed from the summaries of the chunks included
+        in the range, and from the samples of the (at most two) chunks
+        partially included in the range.
+        
+        :param int from_: Index of the first sample of the range
+        :param int to: Index of the last sample of the range
+        :return: Bounding rectangle, or an invalid rectangle for an empty range
+        """
+        if to < from_ or from_ >= self.__size or to < 0:
+            return QRectF(0.0, 0.0, -1.0, -1.0)
+        return qwtRangeRect(self.__bounds(self.__x, self.__xSummary,
+                                          from_, to),
+                            self.__bounds(self.__y, self.__ySummary,
+                                          from_, to))
+    
+    def setRectOfInterest(self, rect):
+        """
+        Set the "rect of interest"
+        
+        :param QRectF rect: Rectangle of interest
+        
+        .. seealso::
+        
+            :py:meth:`rangeOfInterest()`
+        """
+        self.__rectOfInterest = QRectF(rect)
+    
+    def rangeOfInterest(self):
+        """
+        Return the range of samples intersecting the "rect of interest"
+        
+        When x values are increasing (this is checked with the chunk 
+        summaries), the range is found by binary search, reading only a 
+        few pages of the x file. Otherwise, the range of all samples is 
+        returned.
+        
+        :return: Tuple (from_, to) of sample indexes, to < 0 meaning the last sample
+        
+        .. seealso::
+        
+            :py:meth:`setRectOfInterest()`
+        """
+        if self.__rectOfInterest is None or not self.__increasing or\
+           self.__size < 2:
+            return 0, -1
+        return qwtRangeOfInterest(self.__x, self.__rectOfInterest)
+    
+    def levelOfDetail(self):
+        """
+        Return the level of detail pyramid of the series, when x values 
+        are increasing
+        
+        The levels of the pyramid are stored into a sidecar file 
+        (`<file>.lod`), which is memory-mapped: they are built at the 
+        first call, iterating once over the y file, unless the sidecar 
+        file is up to date. When the y values are not read from a file 
+        (or when the sidecar file can't be written), the levels are stored 
+        into a temporary file.
+        
+        :return: `QwtSeriesPyramid` object or None
+        """
+        if self.__pyramid is None and self.__increasing:
+            path = None
+            if self.__yPath is not None:
+                path = self.__yPath+'.lod'
+                try:
+                    if os.path.isfile(path) and os.path.getmtime(path) <\
+                       os.path.getmtime(self.__yPath):
+                        os.remove(path)
+                    self.__pyramid = QwtSeriesPyramid(self.__y, path=path)
+                except (IOError, OSError):
+                    # Read-only directory: levels are stored elsewhere
+                    path = None
+            if path is None:
+                self.__pyramid = QwtSeriesPyramid(self.__y,
+                                                  path=tempfile.TemporaryFile())
+        return self.__pyramid
+    
+    def size(self):
+        """
+        :return: Number of samples
+        """
+        return self.__size
+    
+    def sample(self, index):
+        """
+        :param int index: Index
+        :return: Sample at position `index`
+        """
+        return QPointF(self.__x[index], self.__y[index])
+    
+    def xData(self):
+        """
+        :return: Memory-mapped array of the x-values
+        """
+        return self.__x
+        
+    def yData(self):
+        """
+        :return: Memory-mapped array of the y-values
+        """
+        return self.__y
+
 
 class QwtSeriesStore(object):
     """
@@ -282,9 +1541,8 @@ class QwtSeriesStore(object):
             The item takes ownership of the data object, deleting it 
             when its not used anymore.
         """
-        if self.__series != series:
-            self.__series = series
-            self.dataChanged()
+        self.__series = series
+        self.dataChanged()
     
     def data(self):
         """
@@ -349,4 +1607,5 @@ class QwtSeriesStore(object):
         """
         swappedSeries = self.__series
         self.__series = series
+        self.dataChanged()
         return swappedSeries
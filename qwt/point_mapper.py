@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the terms of the Qwt License
+# Copyright (c) 2002 Uwe Rathmann, for the original C++ code
+# Copyright (c) 2015 Pierre Raybaut, for the Python translation/optimization
+# (see LICENSE file for more details)
+
+"""
+Point mapping helpers
+---------------------
+
+NumPy-based helpers used by plot items to convert series of points
+(already mapped into paint device coordinates) into Qt geometry,
+reducing them beforehand when possible.
+
+.. autofunction:: array_to_polyline
+
+.. autofunction:: array_to_steps
+
+.. autofunction:: polyline_to_array
+
+.. autofunction:: array_to_lines
+
+.. autofunction:: finite_runs
+
+.. autofunction:: minmax_decimation
+
+.. autofunction:: clip_polygon
+
+.. autofunction:: filter_points
+
+.. autofunction:: series_to_image
+"""
+
+from .qt.QtGui import QPolygonF
+from .qt.QtCore import QThread
+from .toqimage import array_to_qimage
+
+import threading
+import numpy as np
+
+
+def array_to_polyline(xs, ys):
+    """
+    Convert arrays of paint device coordinates to QPolygonF polyline
+
+    :param numpy.array xs: Array of x coordinates
+    :param numpy.array ys: Array of y coordinates
+    :return: QPolygonF object
+    """
+    size = min([xs.size, ys.size])
+    if size == 0:
+        return QPolygonF()
+    polyline = QPolygonF(size)
+    pointer = polyline.data()
+    pointer.setsize(2*size*np.dtype(np.float64).itemsize)
+    memory = np.frombuffer(pointer, np.float64)
+    memory[0::2] = xs[:size]
+    memory[1::2] = ys[:size]
+    return polyline
+
+
+def array_to_steps(xs, ys, inverted=False):
+    """
+    Convert arrays of paint device coordinates to QPolygonF step polyline
+    
+    An intermediate point is inserted between two consecutive points: 
+    (x[i+1], y[i]) for a step function going from the left to the right, 
+    (x[i], y[i+1]) for the inverted one.
+
+    :param numpy.array xs: Array of x coordinates
+    :param numpy.array ys: Array of y coordinates
+    :param bool inverted: True for a step function from the right to the left
+    :return: QPolygonF object
+    """
+    size = min([xs.size, ys.size])
+    if size == 0:
+        return QPolygonF()
+    xs, ys = xs[:size], ys[:size]
+    polyline = QPolygonF(2*size-1)
+    pointer = polyline.data()
+    pointer.setsize(2*(2*size-1)*np.dtype(np.float64).itemsize)
+    memory = np.frombuffer(pointer, np.float64)
+    memory[0::4] = xs
+    memory[1::4] = ys
+    if inverted:
+        memory[2::4] = xs[:-1]
+        memory[3::4] = ys[1:]
+    else:
+        memory[2::4] = xs[1:]
+        memory[3::4] = ys[:-1]
+    return polyline
+
+
+def polyline_to_array(polyline, copy=True):
+    """
+    Convert QPolygonF polyline to arrays of paint device coordinates
+
+    :param QPolygonF polyline: Polyline
+    :param bool copy: if False, return views on the buffer of the polyline (valid as long as the polyline is neither modified nor deleted)
+    :return: Tuple of arrays (x coordinates, y coordinates)
+    """
+    size = polyline.size()
+    if size == 0:
+        return np.array([]), np.array([])
+    pointer = polyline.data()
+    pointer.setsize(2*size*np.dtype(np.float64).itemsize)
+    memory = np.frombuffer(pointer, np.float64)
+    if copy:
+        return memory[0::2].copy(), memory[1::2].copy()
+    return memory[0::2], memory[1::2]
+
+
+def array_to_lines(x1, y1, x2, y2):
+    """
+    Convert arrays of paint device coordinates to a QPolygonF of point 
+    pairs (start and end points of each line), to be drawn with a single 
+    call to `QwtPainter.drawLines`
+    
+    Arguments are broadcast against each other: scalars may be used for
+    coordinates shared by all lines.
+
+    :param numpy.array x1: Array of x coordinates of the start points
+    :param numpy.array y1: Array of y coordinates of the start points
+    :param numpy.array x2: Array of x coordinates of the end points
+    :param numpy.array y2: Array of y coordinates of the end points
+    :return: QPolygonF object
+    """
+    x1, y1, x2, y2 = np.broadcast_arrays(x1, y1, x2, y2)
+    size = x1.size
+    if size == 0:
+        return QPolygonF()
+    pointPairs = QPolygonF(2*size)
+    pointer = pointPairs.data()
+    pointer.setsize(4*size*np.dtype(np.float64).itemsize)
+    memory = np.frombuffer(pointer, np.float64)
+    memory[0::4] = x1.ravel()
+    memory[1::4] = y1.ravel()
+    memory[2::4] = x2.ravel()
+    memory[3::4] = y2.ravel()
+    return pointPairs
+
+
+def finite_runs(xs, ys):
+    """
+    Return the runs of consecutive finite points, for drawing a polyline
+    with gaps at non-finite points (e.g. not a number values)
+
+    :param numpy.array xs: Array of x coordinates
+    :param numpy.array ys: Array of y coordinates
+    :return: Tuple of arrays (run starts, run ends), ends being excluded
+    """
+    size = min([xs.size, ys.size])
+    finite = np.isfinite(xs[:size]) & np.isfinite(ys[:size])
+    if finite.all():
+        if size == 0:
+            return np.array([], dtype=np.intp), np.array([], dtype=np.intp)
+        return np.array([0]), np.array([size])
+    edges = np.diff(np.concatenate(([0], finite.view(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def minmax_decimation(xs, ys):
+    """
+    Return the indexes of the points to be kept for drawing a polyline
+    with at most 4 points (first, min, max, last) per pixel column
+
+    Consecutive points falling into the same pixel column are drawn as
+    a vertical stroke going from the minimum to the maximum value:
+    keeping only the first, the minimum, the maximum and the last point
+    of each run results in the same polyline on screen. The reduction is
+    effective when x values are monotonic.
+
+    :param numpy.array xs: Array of x coordinates, in paint device coordinates
+    :param numpy.array ys: Array of y values (either in scale or in paint device coordinates, as long as the transformation is monotonic)
+    :return: Sorted array of indexes
+    """
+    size = min([xs.size, ys.size])
+    if size <= 4:
+        return np.arange(size)
+    xs, ys = xs[:size], ys[:size]
+    columns = np.floor(xs)
+    starts = np.concatenate(([0], np.flatnonzero(columns[1:] != columns[:-1])+1))
+    if 4*starts.size >= size:
+        # Nothing to be gained: at most 4 points per pixel column
+        return np.arange(size)
+    lengths = np.diff(np.append(starts, size))
+    runs = np.repeat(np.arange(starts.size), lengths)
+    keep = np.zeros(size, dtype=bool)
+    keep[starts] = True
+    keep[starts+lengths-1] = True
+    for extremum in (np.fmin.reduceat(ys, starts),
+                     np.fmax.reduceat(ys, starts)):
+        indexes = np.flatnonzero(ys == extremum[runs])
+        indexes_runs = runs[indexes]
+        first = np.concatenate(([True],
+                                indexes_runs[1:] != indexes_runs[:-1]))
+        keep[indexes[first]] = True
+    return np.flatnonzero(keep)
+
+
+def _clip_edge(cs, os_, inside, bound):
+    """Clip polyline against a single edge (Sutherland-Hodgman)"""
+    size = cs.size
+    if size < 2:
+        return cs[inside], os_[inside]
+    c1, c2, o1, o2 = cs[:-1], cs[1:], os_[:-1], os_[1:]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        oi = o1+(bound-c1)*(o2-o1)/(c2-c1)
+    crossing = (inside[:-1] != inside[1:]) & np.isfinite(oi)
+    # Each segment contributes up to 2 points: the intersection with the
+    # edge (when crossing it) and its end point (when inside)
+    c_out = np.empty(2*size-1)
+    o_out = np.empty(2*size-1)
+    keep = np.empty(2*size-1, dtype=bool)
+    c_out[0], o_out[0], keep[0] = cs[0], os_[0], inside[0]
+    c_out[1::2], o_out[1::2], keep[1::2] = bound, oi, crossing
+    c_out[2::2], o_out[2::2], keep[2::2] = c2, o2, inside[1:]
+    return c_out[keep], o_out[keep]
+
+
+def clip_polygon(xs, ys, rect, closed=False):
+    """
+    Clip a polygon (or a polyline) against a rectangle
+
+    The Sutherland-Hodgman algorithm is applied on each edge of the 
+    rectangle, all segments being processed at once. 
+    
+    When clipping a polyline (`closed` is False), parts outside the 
+    rectangle are replaced by lines on its border: the rectangle has to 
+    be enlarged by the pen width to keep them invisible.
+
+    :param numpy.array xs: Array of x coordinates, in paint device coordinates
+    :param numpy.array ys: Array of y coordinates, in paint device coordinates
+    :param QRectF rect: Clip rectangle
+    :param bool closed: True, when the polygon is closed
+    :return: Tuple of arrays (x coordinates, y coordinates)
+    """
+    size = min([xs.size, ys.size])
+    xs = np.asarray(xs[:size], dtype=np.float64)
+    ys = np.asarray(ys[:size], dtype=np.float64)
+    edges = ((True, rect.left(), True), (True, rect.right(), False),
+             (False, rect.top(), True), (False, rect.bottom(), False))
+    # Reduction: when three consecutive points are outside the same edge,
+    # the middle one can't contribute to the clipped polygon
+    for is_x, bound, lower in edges:
+        if xs.size < 3:
+            break
+        cs = xs if is_x else ys
+        if lower:
+            outside = cs < bound
+        else:
+            outside = cs > bound
+        keep = np.ones(xs.size, dtype=bool)
+        keep[1:-1] = ~(outside[:-2] & outside[1:-1] & outside[2:])
+        if not keep.all():
+            xs, ys = xs[keep], ys[keep]
+    for is_x, bound, lower in edges:
+        if xs.size == 0:
+            break
+        # Clipping may open the polygon, when its first point is outside
+        if closed and (xs[0] != xs[-1] or ys[0] != ys[-1]):
+            xs, ys = np.append(xs, xs[0]), np.append(ys, ys[0])
+        cs, os_ = (xs, ys) if is_x else (ys, xs)
+        if lower:
+            inside = cs >= bound
+        else:
+            inside = cs <= bound
+        if inside.all():
+            continue
+        cs, os_ = _clip_edge(cs, os_, inside, bound)
+        xs, ys = (cs, os_) if is_x else (os_, cs)
+    return xs, ys
+
+
+def filter_points(xs, ys):
+    """
+    Return the indexes of the points to be kept for drawing points 
+    at distinct pixel positions
+    
+    Coordinates are rounded to the nearest pixel, and only the last point
+    of each pixel is kept (non-finite points are removed as well).
+
+    :param numpy.array xs: Array of x coordinates, in paint device coordinates
+    :param numpy.array ys: Array of y coordinates, in paint device coordinates
+    :return: Sorted array of indexes
+    """
+    size = min([xs.size, ys.size])
+    xs, ys = xs[:size], ys[:size]
+    finite = np.flatnonzero(np.isfinite(xs) & np.isfinite(ys))
+    if finite.size < 2:
+        return finite
+    # Pack rounded coordinates into a single 64-bit integer key
+    offset = 2**30
+    xi = np.clip(np.floor(xs[finite]+.5), -offset, offset-1).astype(np.int64)
+    yi = np.clip(np.floor(ys[finite]+.5), -offset, offset-1).astype(np.int64)
+    keys = ((xi+offset) << 31) | (yi+offset)
+    # Keeping the last point of each pixel preserves the stacking order
+    indexes = keys.size-1-np.unique(keys[::-1], return_index=True)[1]
+    indexes.sort()
+    return finite[indexes]
+
+
+def _render_points(image, xMap, yMap, series, from_, to, rect, rgba):
+    """Set the pixels of the points of a series range"""
+    cols = np.floor(xMap.transform(series.xData()[from_:to+1])-rect.left()+.5)
+    rows = np.floor(yMap.transform(series.yData()[from_:to+1])-rect.top()+.5)
+    height, width = image.shape
+    with np.errstate(invalid='ignore'):
+        inside = (cols >= 0) & (cols < width) & (rows >= 0) & (rows < height)
+    image[rows[inside].astype(np.intp), cols[inside].astype(np.intp)] = rgba
+
+
+def series_to_image(xMap, yMap, series, from_, to, rect, color,
+                    numThreads=1):
+    """
+    Render the points of a series into an image
+    
+    Each point sets the color of the (aliased) pixel it is mapped to: 
+    the image may then be drawn instead of the points with a single call 
+    to `QPainter.drawImage`.
+    
+    On multi core systems, the series may be split into several parts 
+    rendered in parallel.
+
+    :param .scale_map.QwtScaleMap xMap: Maps x-values into pixel coordinates.
+    :param .scale_map.QwtScaleMap yMap: Maps y-values into pixel coordinates.
+    :param series: Series of points to be mapped
+    :param int from_: Index of the first point to be painted
+    :param int to: Index of the last point to be painted
+    :param QRect rect: Geometry of the image, in paint device coordinates
+    :param QColor color: Color of the points
+    :param int numThreads: Number of threads to be used (0: ideal thread count)
+    :return: QImage object (ARGB32)
+    """
+    image = np.zeros((max([rect.height(), 0]), max([rect.width(), 0])),
+                     dtype=np.uint32)
+    if image.size > 0 and from_ <= to:
+        rgba = color.rgba()
+        numPoints = to-from_+1
+        if numThreads == 0:
+            numThreads = QThread.idealThreadCount()
+        numThreads = max([1, min([numThreads, numPoints//100000])])
+        chunkSize = numPoints//numThreads
+        threads = []
+        for i in range(numThreads-1):
+            index0 = from_+i*chunkSize
+            thread = threading.Thread(target=_render_points,
+                                      args=(image, xMap, yMap, series,
+                                            index0, index0+chunkSize-1,
+                                            rect, rgba))
+            thread.start()
+            threads.append(thread)
+        _render_points(image, xMap, yMap, series,
+                       from_+(numThreads-1)*chunkSize, to, rect, rgba)
+        for thread in threads:
+            thread.join()
+    return array_to_qimage(image, copy=True)
@@ -17,6 +17,20 @@ from .math import qwtFuzzyCompare
 
 from .qt.QtCore import QRectF, QPointF
 
+import numpy as np
+
+
+def qwtScaleMapKey(scaleMap):
+    """
+    Return a key identifying a scale map (scale and paint intervals, 
+    transformation)
+    """
+    transform = scaleMap.transformation()
+    if transform is not None:
+        transform = (type(transform), tuple(sorted(vars(transform).items())))
+    return (scaleMap.s1(), scaleMap.s2(), scaleMap.p1(), scaleMap.p2(),
+            transform)
+
 
 class QwtScaleMap(object):
     """
@@ -134,6 +148,31 @@ class QwtScaleMap(object):
             s = self.__transform.transform(s)
         return self.__p1 + (s - self.__ts1)*self.__cnv
     
+    def transform_array(self, values, out=None):
+        """
+        Transform an array of values related to the scale interval into 
+        values related to the interval of the paint device
+        
+        Values are converted to float64 while being transformed: arrays
+        of any data type (e.g. float32 or int16) are transformed without 
+        intermediate copies (for scales without transformation), and the 
+        result may be written directly into a preallocated array.
+
+        :param numpy.array values: Values relative to the coordinates of the scale
+        :param numpy.array out: Optional float64 array receiving the transformed values (e.g. a view on the buffer of a `QPolygonF`)
+        :return: Transformed values
+        
+        .. seealso::
+        
+            :py:meth:`transform_scalar()`
+        """
+        if self.__transform:
+            values = self.__transform.transform(values)
+        out = np.subtract(values, self.__ts1, out=out, dtype=np.float64)
+        out *= self.__cnv
+        out += self.__p1
+        return out
+    
     def invTransform_scalar(self, p):
         """
         Transform an paint device value into a value in the
@@ -240,6 +279,7 @@ class QwtScaleMap(object):
             :param QPointF pos: Position in scale coordinates
             
         Scalar: scalemap.transform(scalar)
+        Array: scalemap.transform(array) (see :py:meth:`transform_array()`)
         Point (QPointF): scalemap.transform(xMap, yMap, pos)
         Rectangle (QRectF): scalemap.transform(xMap, yMap, rect)
         
@@ -248,6 +288,8 @@ class QwtScaleMap(object):
             :py:meth:`invTransform()`
         """
         if len(args) == 1:
+            if isinstance(args[0], np.ndarray):
+                return self.transform_array(args[0])
             # Scalar transform
             return self.transform_scalar(args[0])
         elif len(args) == 3 and isinstance(args[2], QPointF):
@@ -15,10 +15,13 @@ QwtSymbol
 
 from .graphic import QwtGraphic
 from .painter import QwtPainter
+from .point_mapper import (array_to_polyline, polyline_to_array,
+                           array_to_lines)
 
 from .qt.QtGui import (QPainter, QTransform, QPixmap, QPen, QPolygonF,
-                          QPainterPath, QBrush)
-from .qt.QtCore import QSize, QRect, QPointF, QRectF, QSizeF, Qt, QPoint
+                          QPainterPath, QBrush, QPaintEngine)
+from .qt.QtCore import (QSize, QRect, QPointF, QRectF, QSizeF, Qt, QPoint,
+                        QT_VERSION, QThread, QCoreApplication)
 from .qt.QtSvg import QSvgRenderer
 
 import numpy as np
@@ -121,6 +124,67 @@ def qwtDrawGraphicSymbols(painter, points, numPoint, graphic, symbol):
     painter.setTransform(transform)
 
 
+def qwtIsGuiThread():
+    """Return True when called from the GUI thread (pixmaps may be used)"""
+    app = QCoreApplication.instance()
+    return app is not None and QThread.currentThread() == app.thread()
+
+
+def qwtSymbolPositions(points):
+    """Return the coordinates of the symbol positions as NumPy arrays"""
+    if isinstance(points, QPolygonF):
+        return polyline_to_array(points)
+    xs = np.array([pos.x() for pos in points], dtype=np.float64)
+    ys = np.array([pos.y() for pos in points], dtype=np.float64)
+    return xs, ys
+
+
+def qwtSymbolsOverlap(xs, ys, width, height):
+    """
+    Return True if some of the rectangles of size (width, height), 
+    centered on the positions, intersect each other
+    
+    Positions are hashed on a grid of cells of the size of the rectangles:
+    rectangles may only intersect when they are in the same cell or in 
+    adjacent cells.
+    """
+    if xs.size < 2:
+        return False
+    if not (np.isfinite(xs).all() and np.isfinite(ys).all()) or\
+       max([np.abs(xs).max(), np.abs(ys).max()]) > 1e6:
+        return True
+    cx = np.floor(xs/width).astype(np.int64)
+    cy = np.floor(ys/height).astype(np.int64)
+    cy -= cy.min()-1
+    stride = int(cy.max())+2
+    keys = cx*stride+cy
+    order = np.argsort(keys)
+    sortedKeys = keys[order]
+    if (sortedKeys[1:] == sortedKeys[:-1]).any():
+        return True
+    for ox, oy in ((0, 1), (1, -1), (1, 0), (1, 1)):
+        neighbors = keys+ox*stride+oy
+        index = np.minimum(np.searchsorted(sortedKeys, neighbors),
+                           keys.size-1)
+        found = np.nonzero(sortedKeys[index] == neighbors)[0]
+        other = order[index[found]]
+        if ((np.abs(xs[found]-xs[other]) < width) &
+            (np.abs(ys[found]-ys[other]) < height)).any():
+            return True
+    return False
+
+
+def qwtDrawPolygonSymbols(painter, xs, ys, dx, dy):
+    """
+    Draw polygons, whose vertices are given relative to the positions
+    """
+    numVertices = len(dx)
+    polygons = array_to_polyline((xs[:, np.newaxis]+dx).ravel(),
+                                 (ys[:, np.newaxis]+dy).ravel())
+    for index in range(0, xs.size*numVertices, numVertices):
+        painter.drawPolygon(polygons.mid(index, numVertices))
+
+
 def qwtDrawEllipseSymbols(painter, points, numPoints, symbol):
     painter.setBrush(symbol.brush())
     painter.setPen(symbol.pen())
@@ -129,10 +193,9 @@ def qwtDrawEllipseSymbols(painter, points, numPoints, symbol):
     sh = size.height()
     sw2 = .5*size.width()
     sh2 = .5*size.height()
-    for pos in points:
-        x = pos.x()
-        y = pos.y()
-        r = QRectF(x-sw2, y-sh2, sw, sh)
+    xs, ys = qwtSymbolPositions(points)
+    for r in map(QRectF, (xs-sw2).tolist(), (ys-sh2).tolist(),
+                 [sw]*xs.size, [sh]*xs.size):
         painter.drawEllipse(r)
 
 
@@ -147,11 +210,19 @@ def qwtDrawRectSymbols(painter, points, numPoints, symbol):
     sh = size.height()
     sw2 = .5*size.width()
     sh2 = .5*size.height()
-    for pos in points:
-        x = pos.x()
-        y = pos.y()
-        r = QRectF(x-sw2, y-sh2, sw, sh)
-        painter.drawRect(r)
+    xs, ys = qwtSymbolPositions(points)
+    rects = list(map(QRectF, (xs-sw2).tolist(), (ys-sh2).tolist(),
+                     [sw]*xs.size, [sh]*xs.size))
+    # drawRects fills and strokes the rectangles in a different order than
+    # drawRect, which is only the same when they don't overlap
+    margin = max([1., pen.widthF()])+1.
+    if not rects:
+        return
+    elif not qwtSymbolsOverlap(xs, ys, sw+margin, sh+margin):
+        painter.drawRects(rects)
+    else:
+        for r in rects:
+            painter.drawRect(r)
 
 
 def qwtDrawDiamondSymbols(painter, points, numPoints, symbol):
@@ -160,17 +231,12 @@ def qwtDrawDiamondSymbols(painter, points, numPoints, symbol):
     pen.setJoinStyle(Qt.MiterJoin)
     painter.setPen(pen)
     painter.setBrush(symbol.brush())
-    for pos in points:
-        x1 = pos.x()-.5*size.width()
-        y1 = pos.y()-.5*size.height()
-        x2 = x1+size.width()
-        y2 = y1+size.height()
-        polygon = QPolygonF()
-        polygon += QPointF(pos.x(), y1)
-        polygon += QPointF(x1, pos.y())
-        polygon += QPointF(pos.x(), y2)
-        polygon += QPointF(x2, pos.y())
-        painter.drawPolygon(polygon)
+    sw2 = .5*size.width()
+    sh2 = .5*size.height()
+    xs, ys = qwtSymbolPositions(points)
+    dx = np.array([0., -sw2, 0., sw2])
+    dy = np.array([-sh2, 0., sh2, 0.])
+    qwtDrawPolygonSymbols(painter, xs, ys, dx, dy)
 
 
 def qwtDrawTriangleSymbols(painter, type, points, numPoint, symbol):
@@ -181,22 +247,16 @@ def qwtDrawTriangleSymbols(painter, type, points, numPoint, symbol):
     painter.setBrush(symbol.brush())
     sw2 = .5*size.width()
     sh2 = .5*size.height()
-    for pos in points:
-        x = pos.x()
-        y = pos.y()
-        x1 = x-sw2
-        x2 = x1+size.width()
-        y1 = y-sh2
-        y2 = y1+size.height()
-        if type == QwtTriangle.Left:
-            triangle = [QPointF(x2, y1), QPointF(x1, y), QPointF(x2, y2)]
-        elif type == QwtTriangle.Right:
-            triangle = [QPointF(x1, y1), QPointF(x2, y), QPointF(x1, y2)]
-        elif type == QwtTriangle.Up:
-            triangle = [QPointF(x1, y2), QPointF(x, y1), QPointF(x2, y2)]
-        elif type == QwtTriangle.Down:
-            triangle = [QPointF(x1, y1), QPointF(x, y2), QPointF(x2, y1)]
-        painter.drawPolygon(QPolygonF(triangle))
+    if type == QwtTriangle.Left:
+        dx, dy = [sw2, -sw2, sw2], [-sh2, 0., sh2]
+    elif type == QwtTriangle.Right:
+        dx, dy = [-sw2, sw2, -sw2], [-sh2, 0., sh2]
+    elif type == QwtTriangle.Up:
+        dx, dy = [-sw2, 0., sw2], [sh2, -sh2, sh2]
+    elif type == QwtTriangle.Down:
+        dx, dy = [-sw2, 0., sw2], [-sh2, sh2, -sh2]
+    xs, ys = qwtSymbolPositions(points)
+    qwtDrawPolygonSymbols(painter, xs, ys, dx, dy)
 
 
 def qwtDrawLineSymbols(painter, orientations, points, numPoints, symbol):
@@ -210,15 +270,24 @@ def qwtDrawLineSymbols(painter, orientations, points, numPoints, symbol):
     sh = size.height()
     sw2 = .5*size.width()
     sh2 = .5*size.height()
-    for pos in points:
-        if orientations & Qt.Horizontal:
-            x = round(pos.x())-sw2
-            y = round(pos.y())
-            painter.drawLine(x, y, x+sw, y)
-        if orientations & Qt.Vertical:
-            x = round(pos.x())
-            y = round(pos.y())-sh2
-            painter.drawLine(x, y, x, y+sh)
+    xs, ys = qwtSymbolPositions(points)
+    xs, ys = np.round(xs), np.round(ys)
+    x1, y1, x2, y2 = [], [], [], []
+    if orientations & Qt.Horizontal:
+        x1 += [xs-sw2]
+        y1 += [ys]
+        x2 += [xs-sw2+sw]
+        y2 += [ys]
+    if orientations & Qt.Vertical:
+        x1 += [xs]
+        y1 += [ys-sh2]
+        x2 += [xs]
+        y2 += [ys-sh2+sh]
+    if x1:
+        QwtPainter.drawLines(painter, array_to_lines(np.concatenate(x1),
+                                                     np.concatenate(y1),
+                                                     np.concatenate(x2),
+                                                     np.concatenate(y2)))
 
 
 def qwtDrawXCrossSymbols(painter, points, numPoints, symbol):
@@ -231,13 +300,15 @@ def qwtDrawXCrossSymbols(painter, points, numPoints, symbol):
     sh = size.height()
     sw2 = .5*size.width()
     sh2 = .5*size.height()
-    for pos in points:
-        x1 = pos.x()-sw2
-        x2 = x1+sw
-        y1 = pos.y()-sh2
-        y2 = y1+sh
-        painter.drawLine(x1, y1, x2, y2)
-        painter.drawLine(x2, y1, x1, y2)
+    xs, ys = qwtSymbolPositions(points)
+    x1 = xs-sw2
+    x2 = x1+sw
+    y1 = ys-sh2
+    y2 = y1+sh
+    QwtPainter.drawLines(painter, array_to_lines(np.concatenate((x1, x2)),
+                                                 np.concatenate((y1, y1)),
+                                                 np.concatenate((x2, x1)),
+                                                 np.concatenate((y2, y2))))
 
 
 def qwtDrawStar1Symbols(painter, points, numPoints, symbol):
@@ -245,14 +316,20 @@ def qwtDrawStar1Symbols(painter, points, numPoints, symbol):
     painter.setPen(symbol.pen())
     sqrt1_2 = np.sqrt(.5)
     r = QRectF(0, 0, size.width(), size.height())
-    for pos in points:
-        r.moveCenter(pos.toPoint())
-        c = QPointF(r.center())
-        d1 = r.width()/2.*(1.-sqrt1_2)
-        painter.drawLine(r.left()+d1, r.top()+d1, r.right()-d1, r.bottom()-d1)
-        painter.drawLine(r.left()+d1, r.bottom()-d1, r.right()-d1, r.top()+d1)
-        painter.drawLine(c.x(), r.top(), c.x(), r.bottom())
-        painter.drawLine(r.left(), c.y(), r.right(), c.y())
+    xs, ys = qwtSymbolPositions(points)
+    # Rectangle centered on the position (rounded, as with QPointF.toPoint)
+    left = np.round(xs)+r.left()-r.center().x()
+    top = np.round(ys)+r.top()-r.center().y()
+    right = left+r.width()
+    bottom = top+r.height()
+    cx = .5*(left+right)
+    cy = .5*(top+bottom)
+    d1 = r.width()/2.*(1.-sqrt1_2)
+    lines = array_to_lines(np.concatenate((left+d1, left+d1, cx, left)),
+                           np.concatenate((top+d1, bottom-d1, top, cy)),
+                           np.concatenate((right-d1, right-d1, cx, right)),
+                           np.concatenate((bottom-d1, top+d1, bottom, cy)))
+    QwtPainter.drawLines(painter, lines)
 
 
 def qwtDrawStar2Symbols(painter, points, numPoints, symbol):
@@ -265,26 +342,11 @@ def qwtDrawStar2Symbols(painter, points, numPoints, symbol):
     cos30 = np.cos(30*np.pi/180.)
     dy = .25*symbol.size().height()
     dx = .5*symbol.size().width()*cos30/3.
-    for pos in points:
-        x = pos.x()
-        y = pos.y()
-        x1 = x-3*dx
-        y1 = y-2*dy
-        x2 = x1+1*dx
-        x3 = x1+2*dx
-        x4 = x1+3*dx
-        x5 = x1+4*dx
-        x6 = x1+5*dx
-        x7 = x1+6*dx
-        y2 = y1+1*dy
-        y3 = y1+2*dy
-        y4 = y1+3*dy
-        y5 = y1+4*dy
-        star = [QPointF(x4, y1), QPointF(x5, y2), QPointF(x7, y2),
-                QPointF(x6, y3), QPointF(x7, y4), QPointF(x5, y4),
-                QPointF(x4, y5), QPointF(x3, y4), QPointF(x1, y4),
-                QPointF(x2, y3), QPointF(x1, y2), QPointF(x3, y2)]
-        painter.drawPolygon(QPolygonF(star))
+    xs, ys = qwtSymbolPositions(points)
+    # Vertices, relative to (x1, y1) in units of (dx, dy)
+    vx = np.array([3, 4, 6, 5, 6, 4, 3, 2, 0, 1, 0, 2])*dx-3*dx
+    vy = np.array([0, 1, 1, 2, 3, 3, 4, 3, 3, 2, 1, 1])*dy-2*dy
+    qwtDrawPolygonSymbols(painter, xs, ys, vx, vy)
 
 
 def qwtDrawHexagonSymbols(painter, points, numPoints, symbol):
@@ -293,19 +355,11 @@ def qwtDrawHexagonSymbols(painter, points, numPoints, symbol):
     cos30 = np.cos(30*np.pi/180.)
     dx = .5*(symbol.size().width()-cos30)
     dy = .25*symbol.size().height()
-    for pos in points:
-        x = pos.x()
-        y = pos.y()
-        x1 = x-dx
-        y1 = y-2*dy
-        x2 = x1+1*dx
-        x3 = x1+2*dx
-        y2 = y1+1*dy
-        y3 = y1+3*dy
-        y4 = y1+4*dy
-        hexa = [QPointF(x2, y1), QPointF(x3, y2), QPointF(x3, y3),
-                QPointF(x2, y4), QPointF(x1, y3), QPointF(x1, y2)]
-        painter.drawPolygon(QPolygonF(hexa))
+    xs, ys = qwtSymbolPositions(points)
+    # Vertices, relative to (x1, y1) in units of (dx, dy)
+    vx = np.array([1, 2, 2, 1, 0, 0])*dx-dx
+    vy = np.array([0, 1, 3, 4, 3, 1])*dy-2*dy
+    qwtDrawPolygonSymbols(painter, xs, ys, vx, vy)
 
 
 class QwtSymbol_PrivateData(object):
@@ -340,8 +394,11 @@ class QwtSymbol_PrivateData(object):
         
         class PaintCache(object):
             def __init__(self):
-                self.policy = 0
+                self.policy = QwtSymbol.NoCache
                 self.pixmap = None  #QPixmap()
+                self.renderHints = None
+                self.image = None  #QImage()
+                self.imageRenderHints = None
         self.cache = PaintCache()
 
 
@@ -409,7 +466,7 @@ class QwtSymbol(object):
         But the opposite can be expected for graphic pipelines
         that can make use of hardware acceleration.
 
-        The default setting is AutoCache
+        The default setting is NoCache
 
         ..seealso::
         
@@ -492,7 +549,7 @@ class QwtSymbol(object):
         """
         Change the cache policy
 
-        The default policy is AutoCache
+        The default policy is NoCache
 
         :param int policy: Cache policy
         
@@ -913,9 +970,87 @@ class QwtSymbol(object):
         #TODO: remove argument numPoints (not necessary in `PythonQwt`)
         if numPoints is not None and numPoints <= 0:
             return
-        painter.save()
-        self.renderSymbols(painter, points, numPoints)
-        painter.restore()
+        useCache = False
+        # Don't use the pixmap, when the paint device could generate
+        # scalable vectors, nor when recording a QPicture (which may be 
+        # replayed outside the GUI thread, e.g. see QwtPlotCanvas)
+        if QwtPainter.roundingAlignment(painter) and\
+           not painter.transform().isScaling() and\
+           painter.paintEngine().type() != QPaintEngine.Picture:
+            if self.__data.cache.policy == QwtSymbol.Cache:
+                useCache = True
+            elif self.__data.cache.policy == QwtSymbol.AutoCache:
+                if painter.paintEngine().type() == QPaintEngine.Raster:
+                    useCache = True
+                elif self.__data.style in (QwtSymbol.XCross, QwtSymbol.HLine,
+                                           QwtSymbol.VLine, QwtSymbol.Cross):
+                    # for the very simple shapes using vector graphics is
+                    # usually faster.
+                    pass
+                elif self.__data.style == QwtSymbol.Pixmap:
+                    # no need to have a pixmap cache for a pixmap
+                    # of the same size
+                    useCache = not self.__data.size.isEmpty() and\
+                        self.__data.size != self.__data.pixmap.pixmap.size()
+                else:
+                    useCache = True
+        if useCache:
+            br = self.boundingRect()
+            # The cache is rendered with the hints of the painter: a pixmap
+            # on the GUI thread, an image on the other threads (pixmaps 
+            # are not supported outside the GUI thread)
+            guiThread = qwtIsGuiThread()
+            renderHints = int(painter.renderHints())
+            if guiThread:
+                cache = self.__data.cache.pixmap
+                cacheHints = self.__data.cache.renderHints
+            else:
+                cache = self.__data.cache.image
+                cacheHints = self.__data.cache.imageRenderHints
+            if cache is None or cache.isNull() or cacheHints != renderHints:
+                if guiThread:
+                    cache = QwtPainter.backingStore(None, br.size())
+                    cache.fill(Qt.transparent)
+                else:
+                    cache = QwtPainter.backingStoreImage(br.size())
+                    cache.fill(0)
+                p = QPainter(cache)
+                p.setRenderHints(painter.renderHints())
+                p.translate(-br.topLeft())
+                self.renderSymbols(p, [QPointF()])
+                p.end()
+                if guiThread:
+                    self.__data.cache.pixmap = cache
+                    self.__data.cache.renderHints = renderHints
+                else:
+                    self.__data.cache.image = cache
+                    self.__data.cache.imageRenderHints = renderHints
+            # Stamp the cache at every (rounded) position
+            if isinstance(points, QPolygonF):
+                xs, ys = polyline_to_array(points)
+            else:
+                xs = np.array([point.x() for point in points], dtype=float)
+                ys = np.array([point.y() for point in points], dtype=float)
+            xs = np.floor(xs+.5)+br.left()+.5*br.width()
+            ys = np.floor(ys+.5)+br.top()+.5*br.height()
+            ratio = 1.
+            if QT_VERSION >= 0x050000:
+                ratio = cache.devicePixelRatio()
+            if guiThread:
+                sourceRect = QRectF(cache.rect())
+                create = QPainter.PixmapFragment.create
+                fragments = [create(QPointF(x, y), sourceRect,
+                                    1./ratio, 1./ratio)
+                             for x, y in zip(xs.tolist(), ys.tolist())]
+                painter.drawPixmapFragments(fragments, cache)
+            else:
+                w, h = cache.width()/ratio, cache.height()/ratio
+                for x, y in zip(xs.tolist(), ys.tolist()):
+                    painter.drawImage(QRectF(x-.5*w, y-.5*h, w, h), cache)
+        else:
+            painter.save()
+            self.renderSymbols(painter, points, numPoints)
+            painter.restore()
     
     def drawSymbol(self, painter, point_or_rect):
         """
@@ -1046,7 +1181,7 @@ class QwtSymbol(object):
             pw = 0.
             if self.__data.pen.style() != Qt.NoPen:
                 pw = max([self.__data.pen.widthF(), 1.])
-            rect.setSize(self.__data.size+QSizeF(pw, pw))
+            rect.setSize(QSizeF(self.__data.size)+QSizeF(pw, pw))
             rect.moveCenter(QPointF(0., 0.))
         elif self.__data.style in (QwtSymbol.XCross, QwtSymbol.Diamond,
                                    QwtSymbol.Triangle, QwtSymbol.UTriangle,
@@ -1067,9 +1202,9 @@ class QwtSymbol(object):
             pinPointTranslation = True
         elif self.__data.style == QwtSymbol.Pixmap:
             if self.__data.size.isEmpty():
-                rect.setSize(self.__data.pixmap.pixmap.size())
+                rect.setSize(QSizeF(self.__data.pixmap.pixmap.size()))
             else:
-                rect.setSize(self.__data.size)
+                rect.setSize(QSizeF(self.__data.size))
             pinPointTranslation = True
         elif self.__data.style == QwtSymbol.Graphic:
             rect = qwtScaleBoundingRect(self.__data.graphic.graphic,
@@ -1087,7 +1222,7 @@ class QwtSymbol(object):
                 rect = transform.mapRect(rect)
             pinPointTranslation = True
         else:
-            rect.setSize(self.__data.size)
+            rect.setSize(QSizeF(self.__data.size))
             rect.moveCenter(QPointF(0., 0.))
         if pinPointTranslation:
             pinPoint = QPointF(0., 0.)
@@ -1095,10 +1230,10 @@ class QwtSymbol(object):
                 pinPoint = rect.center()-self.__data.pinPoint
             rect.moveCenter(pinPoint)
         r = QRect()
-        r.setLeft(np.floor(rect.left()))
-        r.setTop(np.floor(rect.top()))
-        r.setRight(np.floor(rect.right()))
-        r.setBottom(np.floor(rect.bottom()))
+        r.setLeft(int(np.floor(rect.left())))
+        r.setTop(int(np.floor(rect.top())))
+        r.setRight(int(np.floor(rect.right())))
+        r.setBottom(int(np.floor(rect.bottom())))
         if self.__data.style != QwtSymbol.Pixmap:
             r.adjust(-1, -1, 1, 1)
         return r
@@ -1117,8 +1252,8 @@ class QwtSymbol(object):
         
             :py:meth:`setCachePolicy()`, :py:meth:`drawSymbols()`
         """
-        if self.__data.cache.pixmap is not None:
-            self.__data.cache.pixmap = QPixmap()
+        self.__data.cache.pixmap = None
+        self.__data.cache.image = None
     
     def setStyle(self, style):
         """
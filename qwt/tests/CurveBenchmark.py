@@ -51,7 +51,10 @@ class BMPlot(QwtPlot):
             curve = QwtPlotCurve()
             curve.setPen(QPen(get_curve_color()))
             curve.setStyle(style)
-            curve.setRenderHint(QwtPlotCurve.RenderAntialiased)
+            if style == QwtPlotCurve.Dots and not USE_PYQWT5:
+                curve.setPaintAttribute(QwtPlotCurve.ImageBuffer)
+            else:
+                curve.setRenderHint(QwtPlotCurve.RenderAntialiased)
             if symbol is not None:
                 curve.setSymbol(symbol)
             curve.attach(self)
@@ -16,7 +16,8 @@ from qwt.qt.QtGui import QApplication, QPen, QBrush, QFrame
 from qwt.qt.QtCore import QSize
 from qwt.qt.QtCore import Qt
 from qwt import (QwtPlot, QwtPlotMarker, QwtSymbol, QwtLegend, QwtPlotCurve,
-                 QwtAbstractScaleDraw)
+                 QwtAbstractScaleDraw, QwtPlotItem, QwtPlotCanvas,
+                 QwtCircularBufferData)
 
 
 class DataPlot(QwtPlot):
@@ -27,18 +28,30 @@ class DataPlot(QwtPlot):
         self.setCanvasBackground(Qt.white)
         self.alignScales()
 
-        # Initialize data
-        self.x = np.arange(0.0, 100.1, 0.5)
-        self.y = np.zeros(len(self.x), np.float)
-        self.z = np.zeros(len(self.x), np.float)
+        # Initialize data: the samples of the last 100 seconds (one every 
+        # 0.2 second) are kept in circular buffers, which are full from the 
+        # start, so that each new sample replaces the oldest one
+        self.time = 0.0
+        x = np.linspace(-100.0, 0.0, 501)
+        self.dataR = QwtCircularBufferData(x.size)
+        self.dataR.extend(-x, np.zeros(x.size))
+        self.dataL = QwtCircularBufferData(x.size)
+        self.dataL.extend(x, np.zeros(x.size))
 
         self.setTitle("A Moving QwtPlot Demonstration")
         self.insertLegend(QwtLegend(), QwtPlot.BottomLegend);
 
         self.curveR = QwtPlotCurve("Data Moving Right")
+        self.curveR.setData(self.dataR)
         self.curveR.attach(self)
         self.curveL = QwtPlotCurve("Data Moving Left")
+        self.curveL.setData(self.dataL)
         self.curveL.attach(self)
+        
+        # Data moving right is plotted against the reversed time, on the
+        # (hidden) top axis
+        self.curveR.setXAxis(QwtPlot.xTop)
+        self.scrollAxes()
 
         self.curveL.setSymbol(QwtSymbol(QwtSymbol.Ellipse,
                                         QBrush(),
@@ -52,12 +65,22 @@ class DataPlot(QwtPlot):
         mY.setLabelAlignment(Qt.AlignRight | Qt.AlignTop)
         mY.setLineStyle(QwtPlotMarker.HLine)
         mY.setYValue(0.0)
+        mY.setItemAttribute(QwtPlotItem.Static)
         mY.attach(self)
+        
+        # The marker is cached into a static layer, rendered again only
+        # when the scales change
+        self.canvas().setPaintAttribute(QwtPlotCanvas.StaticLayer)
 
         self.setAxisTitle(QwtPlot.xBottom, "Time (seconds)")
         self.setAxisTitle(QwtPlot.yLeft, "Values")
     
-        self.startTimer(50)
+        # A sample is acquired every 20 ms, but the plot is redrawn at most
+        # 25 times per second: the replots requested in the meantime are
+        # merged into a single one
+        self.setAutoReplot(False)
+        self.setMaxFrameRate(25)
+        self.startTimer(20)
         self.phase = 0.0
 
     def alignScales(self):
@@ -71,25 +94,32 @@ class DataPlot(QwtPlot):
             if scaleDraw:
                 scaleDraw.enableComponent(QwtAbstractScaleDraw.Backbone, False)
     
+    def scrollAxes(self):
+        self.setAxisScale(QwtPlot.xBottom, self.time-100.0, self.time)
+        self.setAxisScale(QwtPlot.xTop, -self.time, 100.0-self.time)
+    
     def timerEvent(self, e):
         if self.phase > np.pi - 0.0001:
             self.phase = 0.0
+        self.time += 0.2
 
         # y moves from left to right:
-        # shift y array right and assign new value y[0]
-        self.y = np.concatenate((self.y[:1], self.y[:-1]), 1)
-        self.y[0] = np.sin(self.phase) * (-1.0 + 2.0*random.random())
-		
+        # append the new value y at the reversed time
+        y = np.sin(self.phase) * (-1.0 + 2.0*random.random())
+        self.dataR.append(-self.time, y)
+
         # z moves from right to left:
-        # Shift z array left and assign new value to z[n-1].
-        self.z = np.concatenate((self.z[1:], self.z[:1]), 1)
-        self.z[-1] = 0.8 - (2.0 * self.phase/np.pi) + 0.4*random.random()
+        # append the new value z at the time
+        z = 0.8 - (2.0 * self.phase/np.pi) + 0.4*random.random()
+        self.dataL.append(self.time, z)
 
-        self.curveR.setData(self.x, self.y)
-        self.curveL.setData(self.x, self.z)
+        # The buffers are modified in place: the curves have to be notified
+        self.curveR.dataChanged()
+        self.curveL.dataChanged()
+        self.scrollAxes()
 
-        self.replot()
-        self.phase += np.pi*0.02
+        self.requestReplot()
+        self.phase += np.pi*0.008
 
 
 def make():
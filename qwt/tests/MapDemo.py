@@ -16,7 +16,7 @@ import numpy as np
 from qwt.qt.QtGui import QApplication, QPen, QBrush, QMainWindow, QToolBar
 from qwt.qt.QtCore import QSize
 from qwt.qt.QtCore import Qt
-from qwt import QwtPlot, QwtSymbol, QwtPlotCurve
+from qwt import QwtPlot, QwtSymbol, QwtPlotCurve, QwtGrowableData
 
 
 def standard_map(x, y, kappa):
@@ -45,8 +45,7 @@ class MapDemo(QMainWindow):
         self.setCentralWidget(self.plot)
         # Initialize map data
         self.count = self.i = 1000
-        self.xs = np.zeros(self.count, np.float)
-        self.ys = np.zeros(self.count, np.float)
+        self.data = QwtGrowableData(self.count)
         self.kappa = 0.2
         self.curve = QwtPlotCurve("Map")
         self.curve.attach(self.plot)
@@ -55,6 +54,8 @@ class MapDemo(QMainWindow):
                                            QPen(Qt.blue),
                                            QSize(5, 5)))
         self.curve.setPen(QPen(Qt.cyan))
+        self.curve.setPaintAttribute(QwtPlotCurve.FilterPoints)
+        self.curve.setData(self.data)
         toolBar = QToolBar(self)
         self.addToolBar(toolBar)
         # 1 tick = 1 ms, 10 ticks = 10 ms (Linux clock is 100 Hz)
@@ -80,8 +81,8 @@ class MapDemo(QMainWindow):
             self.i = 0
             self.x = random.random()
             self.y = random.random()
-            self.xs[self.i] = self.x
-            self.ys[self.i] = self.y
+            self.data.clear()
+            self.data.append(self.x, self.y)
             self.i += 1
             chunks = []
             self.timer_toc = time.time()
@@ -91,13 +92,12 @@ class MapDemo(QMainWindow):
             self.timer_tic = self.timer_toc
         else:
             self.x, self.y = standard_map(self.x, self.y, self.kappa)
-            self.xs[self.i] = self.x
-            self.ys[self.i] = self.y
+            self.data.append(self.x, self.y)
             self.i += 1
         
     def timerEvent(self, e):
         self.moreData()
-        self.curve.setData(self.xs[:self.i], self.ys[:self.i])
+        self.curve.dataChanged()
         self.plot.replot()
 
 